@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Pack the long protocol texts into mnemos._protocol_pack.
+
+PROTOCOL, METHODOLOGY, BOUNDARIES (mnemos.protocol_core) and ADVANCED_EXAMPLES,
+INVESTIGATION_CHECKLISTS (mnemos.protocol_examples) ship as one lzma stream,
+base85-encoded, decoded on first access. One stream for all of them lets the
+compressor reuse the fragments they share (method catalog, core loop, checklist
+style) across texts. Edit them as plain files and pack them back:
+
+    python scripts/pack_protocols.py unpack DIR   # write every packed text to DIR/NAME.md
+    python scripts/pack_protocols.py pack DIR     # regenerate _protocol_pack.py from DIR/NAME.md
+"""
+
+import base64
+import importlib
+import lzma
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+TARGET = SRC / "mnemos" / "_protocol_pack.py"
+
+# Packed texts, in stream order
+NAMES = ("PROTOCOL", "METHODOLOGY", "BOUNDARIES", "ADVANCED_EXAMPLES", "INVESTIGATION_CHECKLISTS")
+
+SEPARATOR = "\0"
+BLOB_WIDTH = 76
+
+TEMPLATE = '''"""Packed protocol texts - one lzma stream, base85-encoded, decoded on first access.
+
+Generated by scripts/pack_protocols.py - edit the text through it, not here.
+"""
+
+from typing import Dict, Optional
+
+NAMES = {names!r}
+
+_PACKED = (
+{blob}
+)
+
+_texts: Optional[Dict[str, str]] = None
+
+
+def text(name: str) -> str:
+    """One packed text by name (KeyError if unknown) - decodes the whole stream on first call."""
+    global _texts
+    if _texts is None:
+        import base64
+        import lzma  # only needed once a text is read
+        decoded = lzma.decompress(base64.b85decode(_PACKED)).decode('utf-8')
+        _texts = dict(zip(NAMES, decoded.split('\\0')))
+    return _texts[name]
+'''
+
+
+def pack(texts):
+    """NUL-joined texts, lzma-compressed and base85-encoded."""
+    assert all(SEPARATOR not in text for text in texts), "protocol text must not contain NUL"
+    joined = SEPARATOR.join(texts)
+    return base64.b85encode(lzma.compress(joined.encode("utf-8"), preset=9 | lzma.PRESET_EXTREME))
+
+
+def render(texts):
+    """Source of the generated _protocol_pack module."""
+    blob = pack([texts[name] for name in NAMES]).decode("ascii")
+    lines = [blob[i:i + BLOB_WIDTH] for i in range(0, len(blob), BLOB_WIDTH)]
+    return TEMPLATE.format(names=NAMES, blob="\n".join(f"    b'{line}'" for line in lines))
+
+
+def unpack_to(directory):
+    sys.path.insert(0, str(SRC))
+    protocols = importlib.import_module("mnemos.protocols")
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in NAMES:
+        (directory / f"{name}.md").write_text(getattr(protocols, name), encoding="utf-8")
+        print(f"wrote {directory / name}.md")
+
+
+def pack_from(directory):
+    texts = {name: (directory / f"{name}.md").read_text(encoding="utf-8") for name in NAMES}
+    TARGET.write_text(render(texts), encoding="utf-8")
+    print(f"packed {TARGET}")
+
+
+def main(argv):
+    if len(argv) != 3 or argv[1] not in ("pack", "unpack"):
+        sys.exit(__doc__)
+    directory = Path(argv[2])
+    if argv[1] == "unpack":
+        unpack_to(directory)
+    else:
+        pack_from(directory)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
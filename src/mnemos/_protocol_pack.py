@@ -0,0 +1,102 @@
+"""Packed protocol texts - one lzma stream, base85-encoded, decoded on first access.
+
+Generated by scripts/pack_protocols.py - edit the text through it, not here.
+"""
+
+from typing import Dict, Optional
+
+NAMES = ('PROTOCOL', 'METHODOLOGY', 'BOUNDARIES', 'ADVANCED_EXAMPLES', 'INVESTIGATION_CHECKLISTS')
+
+_PACKED = (
+    b'{Wp48S^xk9=GL@E0stWa8~^|S5YJf5;4d~3EL{K*hz2Nmib>p`0&I#T%6uU0U}Qn`5hg>SfJMSY$'
+    b'<U|wQ1S~O-{9AXYqk2UG3cI`%LQg|l6V&o49Q5yVy6K=uf$TDkI)ff_x#*tQnG?;_C6A6dH4vz)('
+    b'tM_d%&S<{Hw$LCBLV3Hp80TP!-=sNT-6HaFc{_1%oj)dokiSS+xGxx~PRN^`=|M0ELjL&A2*nqPr'
+    b'9R-Wr91Czi)|)xnt6(Q#ipVw&H&H*4+CcwL}^TC-WKLn?`biS_)R5tP>=RBZy~;lKHkl~Ay4nSC~'
+    b'j_^5&JrtHz*^qcW64RBsEu$_roiCGk%bhGpaf{nrCWy2FIZ*t6-Z{aM-BjN|IQa{gGz0`)U2h+~j'
+    b'39Tn+g0{bBDAfm!riqefjt3E>XGEqmPd1yv^8C@C@meTGarUcpJx2QL5MqW50-_e5cIhU&ikk6rR'
+    b'k?HK;p@~1%V17QGiFHMe9K^|sp<k<h>p|OctrR~-IPP+HQlh|0zJ2_$kw>sic-N}9iWjRF%*&_oA'
+    b'xzhssaJ7=b1Yj#%-Z%;5DMes2XqGTE5cz)UJ*chElJ{F{S|wi+PdEOtBpgN4W!kt*VN4x`Qv(fkM'
+    b'S(dY$gHTGr8W_tR0v<?gy))QTkTeLdtKiHX!nYaP5wP8WHs>TR7lcDX;`J<?iY;jS7#!2ZD%uUb;'
+    b'5a%f(Xe1)4uKfkeN);oA8g7;u{N=I|j@h1&4I1za7@s};Y{Jg|PzZHykYr*<P-40JcpXflf^7;v)'
+    b'*8_8h3r&|VrSc`6gwj~-VDbh0V<^(|dd>kU_ffv0=1ZKme}~YuR~*0j*vl!TM_XgHhyF~1czx$T<'
+    b'v2FTrVoT}*Vdv@M!YAg6ZyTotV-%2KK<mMC_tkCph-K!SpS$AW(xhWYaUE^#qaG<PwIzqHl~n@hs'
+    b'jKTWx%)U|Jv+q=j+I#nRbZEnX5!JB9FQ_Z$~Kz;>T{cg#I}VU&?iruAX^J6TE72e9Eu^fVA!b^+P'
+    b'_z{mT=6@}nG*WtxcB<7Pya&1KFCXDMU@2vCI-6ouGqktH!4?dH0ECvMHW%4LI-gxPJ>_`GreL(<!'
+    b'>K}ERff$VgRG$I$@VU4>vLRD80)5r&At$%nFi!otim2r}#3G+^CSoi2kd^}1RM;%<_1#xoV_nHeL'
+    b'18lYpaNk+8E2uGP6Hwp`fsWhox;JQAlht(j?#!g|?KI}%Zml`#J>?g*Ks-+JDW%3wgvW@%lK8m|h'
+    b'4}idp#Q=962`z_ky@W5UYT4aQ;VKS1(AyJC#d(V6-TAv^k%eI8pz_n3LV~nFf$!#27Nc+3E>u>TG'
+    b'D!Z0mLJ}qFB&GA08<?UmzpH#<wafU2y$^-0<7J;sYy_o~Z2sfIJn-FC(eOIc4*!*&(=UR?R+2^o7'
+    b'Y>)_Wk-v}TvpC&$bFI2)2$9PwO5#c`KNE%N*^q=f0(GP~r!6tFj^ndo}w=THo29$yN#$`Of;4+t#'
+    b'd;`|WQr1Y3rL)7e;XlyLq3uZdv7gd&Gp(7RrD$3F74u0s~cZB2(DCRk7S6CW}gF3&-hp*~KsIS+`'
+    b'xk7ht<To)mZJcG%@N9l;TC}bz=WW+O|2G2|QMft$D^c6vSXxh<*H`IEU<0~<=ql;)_}VzXJ=M6p*'
+    b'CwvT3F%Z-tW0DW6jjevUU&`UT*1)66<TWJ*PucN{`~E)Q3(#WH$>j}lM-;Zlls3W-lQzJi2k!ex-'
+    b'y$xE`YD>V`dh|=AU+}Wz5FCR?0_Wkjb(_?ku_gU$(lgWjy0JdZfw7;e$v;{xrnYcdRUQB&HnBN3%'
+    b'd4;<jJCqV^!S1F`wJOVsEfC*(KNX1Mns|JNLW8udy5c7B7@ut*%zXrqvdsncDkhsW)ein`h7qt1F'
+    b'r?NnBKxiT)svCsmVsk`y5z8gCfg$^ZkwacqFpY7K7Su}m3C1ykTG7Ru{)!^<iZVeom2ALWDhY@yR'
+    b'H2eFC)4~tR@~FRhIttQY;o1`0++!5SC3o))3r)@#4C>oZKme~krJGz+mRpkV0@oDmNNh{canMDeg'
+    b'_g8HL?)*5Kb_@egKC%w2>g!8MobQbINQz|q<`{6vwdb#Z0l=6UR@E*^l41NDXBwxVkFIX!~$`LGd'
+    b'(oBm5Oc+>D0B(RX_O;l1;Yx_5B+Hq^|iQ$~?ziFdf|dFf?HXuq&teqX3wvz(LlQ2v!wgq$70}FnN'
+    b'%(!J7BgL>T*$FE7j+!dz)Rk?Fyd%nB&Tai62C`EzN9)EeelX@tH1ZHFYbRnQnhSft4G@_P&~3}C$'
+    b'd`boIgB}E2k2bV)tHQXv5S+!Q+=^a(_XFC&}D)~Xn=LJ<s1Yh~{b5~995ZN%yw)5)+kxr!{#>a_H'
+    b'_Rq#Tvw^z+AoHq~W8>ss()4z7kvSs_WnDG`seC&kpZX3e4r|5vyd=_4qo{s@&4Hm&K4E{PBZQi*A'
+    b'+cu~#{M3TTnY(drr?MU6Nk|3ec|G5V}y5L%yDD!IDR$}<{cQz%6Q_ndAO7TnNoD(D;qsz#;tl|*8'
+    b'#>aW=7^7n(UrF{M@nY?Q~H+zqzsOlPwI&`TsJnakD!!Ee)SEg;lVJ<}>j>?z=`*sOhyUp(ED7X4b'
+    b'TE&6PGb*nV7-)0-E0rtOjw=zi4KqfK5PzSx#%x5%5J&TjeiY<Htmh@6iBZ1Xr(U2@D}K%7H9zX$b'
+    b'jz9H0QBljvH8hMaMSvUVLp6QD#yGo;V%xl2Tjp{%k6J4T?->D<D>_dAC-N+Mk7{)^|s8O&GTJk{T'
+    b'K2!MPzU8KyF}jTGLP`*AUIwyth(C0wm93H5gdk#p#hCg};V5ZI7UXH*)fxmM*@~!QZu-)1sTw~3l'
+    b'ifIw6zAu{@UB;cwq~nw-Ca@jMB04D0x1sx&y>D&Z6!i!@4h+y;O4)8oT+w5SvCZXJWRFO=*PL~a7'
+    b'_Uuqipc6=vWS{b>1*{5Jdnyp2I|5UP{t6Y$Tg&=7ns8TNx9-#C&5PpT_yn6XC0HvnF@z%_(QvwM1'
+    b'y6k1ot2nav2G6v^lpua^F)ouSxK%jvSF3ef#fD2d&tAir4OR+D$50!8Z|OahmYI2K7;Klr_qY)SK'
+    b'(_Zl->a4NIeF=D7mK(U9<DUCDmcht)C)Xtx?OLk1uHUY?4>X%5C9L>g*rc#I$*u!pKjiD-YHt^!0'
+    b'fTzV{vUUoj`f;*04M9DSq4GQ)9b2=Ke~_iDmR(uGnkzo*L*8qu4yfHR0IbC-t)3A%2SssD>{L17G'
+    b'x{bkick6>iT`#!Cz{J$sDCB_jS>BD?UTzL3L3?KA2zkHH$yNy+&>|R4F4WLEfi`tFIF3M_1KM_p@'
+    b'HvjwLH|-DQJL}`bKQK13O)OH$E;jI;AZD#6`W~4ni0;e`i1T+Dg6@>uHsjQ+B7bJM5jLO#8D6^Fs'
+    b'xUjHLP0YSP;#YQ@EqoPgIs#mOYZ2B#@G#SE`?K_d(DumnI=Sbwbi$l@~6a|*|czVkPca<|WOI7p{'
+    b'>63#v`t*I5qgf%~<xi6+?F-}=jRkQILlau(ck1xwW9G87cfj^UWI+5L8`%Q^=7;Y_uf*ucWNqSGi'
+    b'AeQOW<S7oFIzk9Vh^-ed@;%@*I`BTi5_D5LRQb91`D!gTS@KZHNJK2$@@#FAYLcn~b{oJK{)Ae<c'
+    b'yVR2V#$Nb08MI{w2IQCWB8rAxxi=|%d}dU4-Ql*%taU?<~6*&?x#gUr1u^q$_!cc0Km-<my1V(KJ'
+    b'50GbqPJCuMo49S2Ih?Edy_%i`qaS=a7TUiV_c^@1FA`97zQ>h363x=i$vIMn8LPAV$3w_-__$4*s'
+    b'I{fhb;-_wMQ#C621ZVNb+ne<aOmEwekk1)GoSh=kz_EWOHaadb&<oPh)0OV-UK6yU~E{gF$Gmg+5'
+    b'KV=T9y8$0*YI5?k7f_50`vM=ezpwr%_@kkvt*u{0YE`SFmd#uAm{}egbZ%7wJ<*2V5n{JcF>!KLl'
+    b'YoF*qvppF<;hZEtc&KhBfpglKd#?wz&>w}*HYvyejUlYuyPZIkt-|@XZE4NWa97qdh%T5I^G@&Et'
+    b'1a1QAjtI|V3-}^NuVD*fQeO$S^vZY(Cc2NQlZ!!i0DMA4C4$C17|IM&|AV7&x+jB_ih;~KTFulS8'
+    b'Y{ql-Y%Ko3#kW+{J_DX3|H`9q+=ooCW~HhSNU|uCBZ@sCnL)zDijaVOKqc7N1?7+4<H@ORw>&Mnu'
+    b'vv4wV-*c~@0q@drzy6}MnM1V{s28>{{sYLjy=23!bE8i+C~GQM91wNHg;Ou9WX<Tu*tV04CN1IDq'
+    b';OdaZnAF6l6=q^aF*0HBbGyxj`hLAt)+T483e*lNlyT<07t!^rdA~|OHPY_i9#a+uK5Zj&pk9z(l'
+    b'qeNR`8ZIvt)*^wM<mfru_$*;Syu*8V#i$t3CsS*UBC|0v&!r<ILyoHVSS)m8DlXJhiymY5HywTQA'
+    b'CzirjAu>lX+`oMrEhs_cOvlW?pADEeovA^asIjN{3uH(dl!(I17*5-nT|(%zczJb_6J8Imwd<z?q'
+    b'A&{ReN|Kq0t9!^%RKBvHjIgee7B`3j5U%VQjfl46aF^qHO%h^%1fqk1<F`OAO!L6ANc%zI|WGnJ?'
+    b'=7j4#u0p2GnUwJ0<J|8P;b&E2H|Piv-cqT>VSTQhKA*vR1-uVqv|zPvqY5N;(=btQlb7!r!^QJfP'
+    b'=qI%&llRO-TCsx}5<hcc26eKR(f}=cgL=fFxc!U-0qc4Ixu%^cX0REZbZeP;;;XH9AgmMC7{ot#~'
+    b'xPK%7b6~R>=7QeiPTtclVGE$17tp)qEF2b%=}Yr4;I8gUyQABop&xuCzExp6^6`}8sa5$O7udFQw'
+    b'?vT=txo$7`w5XdhaK}2&q0I05`T_r@AdxV=kN#gx(VE+)+wDx@-HPNMg5B8`n_P6wow$S<d-#?Yl'
+    b'Z(En-K9QmYZ}n74YF9yw3t{rrnQW+P*#*Ws>(|Fcf|ZsK+Kd@+e4{)L*Y;tc(O78gFc2L8jd%I8U'
+    b'VzKitz1q{YX6ttjt<mCdMR__tiU>TW&TH17DwXfb2#w)+mMzSt(u$Fe%ki7QWdVh9*A6)X!j2P8;'
+    b'a_1Z*`PE%tgP>O>_$6TI^fFg-k4YQ~(xW&;?2@A03VJIXRM{?5=OsOQPGB$-m0uh|6y%aODEcSSA'
+    b'vP&r+?TUq31ij2fYUB#XJ1pgYc&0?js))#TnzgW10u8id?BIHq3=;@WJ1dDj5hzX5DyHQ_$Nz;&f'
+    b'pN!k&#7{*5=&a8dPVS(E`buoNB8PzT)SO~no@E})E5|?@k7O;!i{Q|nk5Foa1;cNhtU==^aMK!G='
+    b'c~c-wcav4VGQB(Fx6)W#`dt-GiIogCHlKQIv?m!X^R2H<l5Dv8L=wDC)5-ZUo{so+dTO156Jp4ky'
+    b';FGmtZaZ5R=#D*=SFO;-?SFBSp6_1{2>e}waLbK6}!Y6r$C>n%Xd_0v>l7R`=a-S+tZum?hv3iGR'
+    b'mM3BbXMNk90=k*2{m>^BE?A2{Y+gA+C`ed96;0`OO_8_Z(R^2Wc=5jJ}{HC`L#hOGp$$hx6os~wD'
+    b'iG{zhb;wRlE3Zv4AxBd!hpN5**jKZ?>*Oa&*iAvxGWc)|J|^8lQ;0~>A3d-V1bnV7bq>L;5f9s$e'
+    b'}{iMeMxPEiGgYS#ar17q%YjYmqrEHU7nIo2RKXa*hoZ{G<rZOPrZDvWfLIP)82&@$At=*v*DWs?3'
+    b'sQg)Bq)?e6iBGS!LN@p_z4{F1eTb9-`NT3LxcZZ-!(C+yeP9@}4m-7pAE#b=%D}W}q$a$w+@8Ek;'
+    b'qm3}zHV61K{aOyI;I0-EQ2Ya&&H3PrCiwdmlVF~-i(e3i^E95Gse*A%=~mxj}hxaB!Gt6Z9{uB_s'
+    b'#tVYYD|Bn#m${U3}YXuG=8OVsD8Q_Uq3*BRs1w1<h(<wi{B*0JI$*TUD>HV#;yjjQ2jJ^wbrHrK}'
+    b'03gJj9QOgDjLU5}?V#JdrzZl$QGq0(dhei_zR773DW-!p`h4Y;MmH3MGH(7w64#ytln`gGGYoPfr'
+    b'3+2)B^OJcRY+neu-f*LcwAdu(bd&$wgBat^QD7%7Rdcaoa2l**wrt_)prAg;J02*z36v#v4$V<h6'
+    b'5G=i{D8qKvx5600GD(w_X4MS+pqZvBYQl0ssI200dcD'
+)
+
+_texts: Optional[Dict[str, str]] = None
+
+
+def text(name: str) -> str:
+    """One packed text by name (KeyError if unknown) - decodes the whole stream on first call."""
+    global _texts
+    if _texts is None:
+        import base64
+        import lzma  # only needed once a text is read
+        decoded = lzma.decompress(base64.b85decode(_PACKED)).decode('utf-8')
+        _texts = dict(zip(NAMES, decoded.split('\0')))
+    return _texts[name]
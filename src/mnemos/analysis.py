@@ -1,10 +1,38 @@
 """Mnemos analysis methods - meta-reflection, pattern detection."""
 
+import heapq
+import io
 import json
-import time
+import os
 from pathlib import Path
 from typing import Dict, Any, List
 
+from . import jsonl
+from .logging import _timestamp
+
+
+def _tail_lines(path: Path, count: int) -> List[bytes]:
+    """Last `count` non-blank lines of a file, read backwards from EOF in blocks."""
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        while True:
+            step = min(io.DEFAULT_BUFFER_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+            if newlines < count and pos:
+                continue
+            
+            # Until the start of the file is reached, the first piece may be a partial line
+            pieces = b''.join(reversed(chunks)).split(b'\n')
+            lines = [line for line in (pieces[1:] if pos else pieces) if line.strip()]
+            if len(lines) >= count or not pos:
+                return lines[-count:]
+
 
 class MnemosAnalyzer:
     """Meta-analysis and pattern detection for Mnemos investigation system."""
@@ -18,16 +46,20 @@ class MnemosAnalyzer:
         if not self.log_file.exists():
             return []
             
-        findings = []
-        with open(self.log_file) as f:
-            for line in f:
-                if line.strip():
-                    findings.append(json.loads(line))
-        return findings[-limit:]  # Last N entries
+        if limit <= 0:
+            # Degenerate limits keep their slice semantics
+            with open(self.log_file, 'rb') as f:
+                return [jsonl.loads(line) for line in f if line.strip()][-limit:]
+        
+        # Last N entries - read from the end of the file, only these get decoded
+        return [jsonl.loads(line) for line in _tail_lines(self.log_file, limit)]
     
     def active_threads(self) -> List[str]:
         """Get currently active investigation threads."""
-        recent = self.load_recent(20)
+        return self._active_threads(self.load_recent(20))
+    
+    def _active_threads(self, recent: List[Dict]) -> List[str]:
+        """Active threads among already-loaded recent findings."""
         threads = []
         
         for finding in reversed(recent):  # Most recent first
@@ -72,9 +104,9 @@ class MnemosAnalyzer:
         completed_threads = [t for t, s in thread_outcomes.items() if s == "completed"]
         
         reflection = {
-            "timestamp": time.strftime("%H:%M:%S"),
+            "timestamp": _timestamp(),
             "findings_analyzed": len(recent),
-            "issue_hotspots": dict(sorted(issue_locations.items(), key=lambda x: x[1], reverse=True)[:3]),
+            "issue_hotspots": dict(heapq.nlargest(3, issue_locations.items(), key=lambda x: x[1])),
             "completed_investigations": len(completed_threads),
             "pattern_insights": self._generate_pattern_insights(issues, discoveries, issue_locations),
             "type": "meta_reflection"
@@ -109,12 +141,12 @@ class MnemosAnalyzer:
         return insights if insights else ["No clear patterns detected yet"]
     
     def summarize(self) -> Dict[str, Any]:
-        """Efficient summary for fresh sessions."""
+        """Efficient summary for fresh sessions - counts cover the last 20 findings."""
         recent = self.load_recent(20)
         
         issues = [f for f in recent if f.get("type") in ["bug", "issue"]]
         discoveries = [f for f in recent if f.get("type") == "discovery"]
-        active = self.active_threads()
+        active = self._active_threads(recent)
         
         # Check if meta-reflection is due
         total_findings = len([f for f in recent if f.get("type") in ["bug", "issue", "discovery"]])
@@ -132,11 +164,10 @@ class MnemosAnalyzer:
         # Include last reflection if available
         if self.reflection_file.exists():
             try:
-                with open(self.reflection_file) as f:
-                    lines = [line for line in f if line.strip()]
-                    if lines:
-                        last_reflection = json.loads(lines[-1])
-                        summary["last_reflection"] = last_reflection
+                lines = _tail_lines(self.reflection_file, 1)
+                if lines:
+                    last_reflection = jsonl.loads(lines[-1])
+                    summary["last_reflection"] = last_reflection
             except:
                 pass
         
@@ -1,9 +1,9 @@
 """Auto-initialization and rich summary for mnemos CLI."""
 
-import json
 from pathlib import Path
 from typing import List, Dict
 
+from .. import jsonl
 from ..core import Mnemos
 from .formatters import OutputFormatter
 
@@ -54,10 +54,10 @@ def show_rich_summary(mnemos: Mnemos):
         return
     
     entries = []
-    with open(log_file) as f:
+    with open(log_file, 'rb') as f:
         for line in f:
             if line.strip():
-                entries.append(json.loads(line))
+                entries.append(jsonl.loads(line))
     
     print(OutputFormatter.rich_summary(entries, len(entries)))
 
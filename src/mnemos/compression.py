@@ -1,9 +1,69 @@
 """Mnemos compression methods - findings compression and archival."""
 
+import heapq
 import json
+import os
 import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from . import jsonl
+from .logging import _timestamp
+
+
+# Findings compression and its health checks work on - the tail of the log
+_STATS_WINDOW = 1000
+
+# Per-type field kept alongside the type in the stats index
+_STATS_KEY_FIELD = {"issue": "id", "resolved": "issue_id", "semantic_summary": "compression_id"}
+
+
+def _decode_finding(line: bytes) -> Optional[Dict[str, Any]]:
+    """The finding on one log line - None for blank, undecodable or non-object lines."""
+    if not line.strip():
+        return None
+    try:
+        finding = jsonl.loads(line)
+    except ValueError:
+        return None
+    return finding if isinstance(finding, dict) else None
+
+
+def _stats_row(line: bytes) -> Optional[List[Any]]:
+    """[type, key] for one log line - None for lines _decode_finding skips."""
+    finding = _decode_finding(line)
+    if finding is None:
+        return None
+    entry_type = finding.get("type")
+    field = _STATS_KEY_FIELD.get(entry_type)
+    return [entry_type, finding.get(field) if field else None]
+
+
+def _newest_compression_id(rows: List[List[Any]], current: Any) -> Any:
+    """compression_id of the last semantic summary in rows - current if there is none."""
+    for entry_type, key in reversed(rows):
+        if entry_type == "semantic_summary":
+            return key
+    return current
+
+
+class Finding:
+    """Slotted view of a finding - flat attribute access for classification.
+
+    Only the fields compression inspects are lifted out; the original dict is
+    kept in ``raw`` and is what gets written back to disk.
+    """
+    __slots__ = ("type", "severity", "location", "id", "understanding", "raw")
+
+    def __init__(self, raw: Dict[str, Any]):
+        get = raw.get
+        self.type: Optional[str] = get("type")
+        self.severity: Optional[str] = get("severity")
+        self.location: Optional[str] = get("location")
+        self.id: Optional[str] = get("id")
+        self.understanding: Optional[str] = get("understanding")
+        self.raw = raw
 
 
 class MnemosCompressor:
@@ -11,22 +71,115 @@ class MnemosCompressor:
     
     def __init__(self, log_file: Path):
         self.log_file = log_file
+        self.stats_file = log_file.with_name(f".{log_file.stem}.idx.json")
+        self._stats_state: Optional[Tuple[jsonl.LogPosition, List[List[Any]], Any]] = None
+        self._stats: Optional[Tuple[Tuple[int, int, int], List[List[Any]], Any]] = None
         
     def load_findings(self, limit: int = 1000) -> List[Dict]:
-        """Load findings for compression analysis."""
+        """Load findings for compression analysis.
+        
+        Skips the same blank/corrupt lines as the stats index, so finding_stats()
+        describes exactly these findings.
+        """
         if not self.log_file.exists():
             return []
             
+        # One read, split in C
+        lines = self.log_file.read_bytes().split(b'\n')
+        if limit <= 0:
+            # Degenerate limits keep their slice semantics - decode everything
+            findings = [finding for finding in map(_decode_finding, lines) if finding is not None]
+            return findings[-limit:]
+        
+        # Only the last N findings get decoded - scan back from the end of the log
         findings = []
-        with open(self.log_file) as f:
-            for line in f:
-                if line.strip():
-                    findings.append(json.loads(line))
-        return findings[-limit:]  # Last N entries
+        for line in reversed(lines):
+            finding = _decode_finding(line)
+            if finding is not None:
+                findings.append(finding)
+                if len(findings) == limit:
+                    break
+        findings.reverse()
+        return findings  # Last N entries
+    
+    def finding_stats(self) -> Dict[str, Any]:
+        """Composition of the last 1000 findings (what load_findings() holds) without decoding them."""
+        rows, last_compression_id = self._stats_index()
+        rows = rows[-_STATS_WINDOW:]
+        resolved_ids = {key for entry_type, key in rows if entry_type == "resolved"}
+        return {
+            "total": len(rows),
+            "by_type": Counter(entry_type for entry_type, _ in rows),
+            "unresolved_issues": sum(1 for entry_type, key in rows
+                                     if entry_type == "issue" and key not in resolved_ids),
+            # compression_id of the newest semantic summary anywhere in the log (its epoch
+            # seconds), None if never compressed - kept by the index, not searched for
+            "last_compression_id": last_compression_id
+        }
+    
+    def _stats_index(self) -> Tuple[List[List[Any]], Any]:
+        """[type, key] per finding line and the newest compression_id, kept through a sidecar index.
+        
+        key is the id for issues, the issue_id for resolutions and the compression_id
+        for semantic summaries; the newest compression_id is tracked over the whole log,
+        not just the rows kept. The index is extended with lines appended since it was
+        written and rebuilt when the log has been rewritten.
+        """
+        try:
+            stat = os.stat(self.log_file)
+        except FileNotFoundError:
+            return [], None
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if self._stats is not None and self._stats[0] == stamp:
+            return self._stats[1], self._stats[2]
+        
+        position, rows, last_compression_id = self._stats_state or self._read_stats_file()
+        with open(self.log_file, 'rb') as f:
+            if position is None or not position.continues_in(f, stat):
+                position, rows, last_compression_id = jsonl.LogPosition(stat.st_ino), [], None
+            lines, unterminated = position.read_appended(f, stat.st_size)
+        
+        if lines:
+            new_rows = [row for row in map(_stats_row, lines) if row is not None]
+            last_compression_id = _newest_compression_id(new_rows, last_compression_id)
+            rows.extend(new_rows)
+            del rows[:-_STATS_WINDOW]
+            self._write_stats_file(position, rows, last_compression_id)
+        self._stats_state = (position, rows, last_compression_id)
+        
+        # A line still being written counts now but is only indexed once complete
+        pending = _stats_row(unterminated)
+        if pending is not None:
+            rows = rows + [pending]
+            last_compression_id = _newest_compression_id([pending], last_compression_id)
+        self._stats = (stamp, rows, last_compression_id)
+        return rows, last_compression_id
+    
+    def _read_stats_file(self) -> Tuple[Optional[jsonl.LogPosition], List[List[Any]], Any]:
+        """Load the sidecar index - (None, [], None) if missing or unreadable."""
+        try:
+            with open(self.stats_file) as f:
+                data = json.load(f)
+            return (jsonl.LogPosition.from_json(data["position"]), data["rows"],
+                    data["last_compression_id"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None, [], None
+    
+    def _write_stats_file(self, position: jsonl.LogPosition, rows: List[List[Any]],
+                          last_compression_id: Any) -> None:
+        """Persist the sidecar index atomically; it is only a cache, so failures are ignored."""
+        tmp_path = self.stats_file.with_name(self.stats_file.name + ".tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"position": position.to_json(), "rows": rows,
+                           "last_compression_id": last_compression_id}, f)
+            os.replace(tmp_path, self.stats_file)
+        except (OSError, TypeError, ValueError):
+            pass
     
     def compress_findings(self, keep_recent: int = 15) -> Dict[str, Any]:
         """Reversible semantic compression - preserve signal, compress noise with recovery."""
-        findings = self.load_findings(1000)
+        findings = [Finding(f) for f in self.load_findings(1000)]
         
         if len(findings) <= keep_recent:
             return {"status": "no_compression_needed", "count": len(findings)}
@@ -36,13 +189,19 @@ class MnemosCompressor:
         old = findings[:-keep_recent]
         
         # PRESERVE: High-value findings regardless of age
-        discoveries = [f for f in old if f.get("type") == "discovery"]
-        patterns = [f for f in old if f.get("type") == "pattern"]
-        principles = [f for f in old if f.get("type") == "principle"]
-        critical_issues = [f for f in old if f.get("type") in ["bug", "issue"] and f.get("severity") == "critical"]
-        
         # COMPRESS: Regular observations and resolved issues
-        regular_findings = [f for f in old if f not in discoveries + patterns + principles + critical_issues]
+        discoveries, patterns, principles, critical_issues, regular_findings = [], [], [], [], []
+        for finding in old:
+            if finding.type == "discovery":
+                discoveries.append(finding)
+            elif finding.type == "pattern":
+                patterns.append(finding)
+            elif finding.type == "principle":
+                principles.append(finding)
+            elif finding.type in ("bug", "issue") and finding.severity == "critical":
+                critical_issues.append(finding)
+            else:
+                regular_findings.append(finding)
         
         # Create reversible compression archive
         compression_id = int(time.time())
@@ -53,7 +212,7 @@ class MnemosCompressor:
             compression_metadata = {
                 "type": "compression_metadata",
                 "compression_id": compression_id,
-                "timestamp": time.strftime("%H:%M:%S"),
+                "timestamp": _timestamp(),
                 "compressed_count": len(regular_findings),
                 "compression_trigger": f"Compressed when memory exceeded {keep_recent + len(old)} entries",
                 "recovery_command": f"mnemos decompress {compression_id}"
@@ -61,7 +220,7 @@ class MnemosCompressor:
             f.write(json.dumps(compression_metadata) + '\n')
             
             for finding in regular_findings:
-                f.write(json.dumps(finding) + '\n')
+                f.write(json.dumps(finding.raw) + '\n')
         
         # Semantic summary with recovery pointer
         compressed_summary = self._create_semantic_summary(regular_findings, len(old))
@@ -71,11 +230,10 @@ class MnemosCompressor:
         
         # Final memory: semantic summary + preserved findings + recent
         preserved = discoveries + patterns + principles + critical_issues
-        compressed = [compressed_summary] + preserved + recent
+        compressed = [compressed_summary] + [f.raw for f in preserved + recent]
         
         # Backup original (keep for safety)
-        backup_path = self.log_file.with_suffix(f'.backup_{compression_id}.jsonl')
-        backup_path.write_text(self.log_file.read_text())
+        backup_path = self._backup_log(f'backup_{compression_id}')
         
         with open(self.log_file, 'w') as f:
             for finding in compressed:
@@ -93,30 +251,30 @@ class MnemosCompressor:
             "backup_created": str(backup_path)
         }
     
-    def _create_semantic_summary(self, compressed_findings: List[Dict], total_old: int) -> Dict[str, Any]:
+    def _create_semantic_summary(self, compressed_findings: List[Finding], total_old: int) -> Dict[str, Any]:
         """Create intelligent summary preserving essential patterns."""
-        observations = [f for f in compressed_findings if f.get("type") == "observation"]
-        insights = [f for f in compressed_findings if f.get("type") == "insight"]
-        regular_issues = [f for f in compressed_findings if f.get("type") in ["bug", "issue"]]
+        observations = [f for f in compressed_findings if f.type == "observation"]
+        insights = [f for f in compressed_findings if f.type == "insight"]
+        regular_issues = [f for f in compressed_findings if f.type in ("bug", "issue")]
         
         # Extract semantic patterns
         issue_locations = {}
         for issue in regular_issues:
-            loc = issue.get("location", "unknown")
+            loc = "unknown" if issue.location is None else issue.location
             module = loc.split("/")[0] if "/" in loc else loc
             issue_locations[module] = issue_locations.get(module, 0) + 1
         
         # Key insights extraction
-        key_insights = [i.get("understanding", "") for i in insights[-3:]]
+        key_insights = ["" if i.understanding is None else i.understanding for i in insights[-3:]]
         
         return {
-            "timestamp": time.strftime("%H:%M:%S"),
+            "timestamp": _timestamp(),
             "type": "semantic_summary",
             "period_summary": f"Compressed {len(compressed_findings)} routine findings from {total_old} total",
             "observation_patterns": len(observations),
             "insight_patterns": len(insights),
             "routine_issues": len(regular_issues),
-            "issue_hotspots": dict(sorted(issue_locations.items(), key=lambda x: x[1], reverse=True)[:3]),
+            "issue_hotspots": dict(heapq.nlargest(3, issue_locations.items(), key=lambda x: x[1])),
             "key_insights": key_insights,
             "compression_intelligence": "Preserved discoveries, patterns, principles. Compressed routine observations."
         }
@@ -158,6 +316,9 @@ class MnemosCompressor:
         if not archive_candidates:
             return {"status": "no_candidates", "count": 0}
         
+        # Raw copy of the log first - the rewrite below drops lines load_findings() skipped
+        log_backup = self._backup_log(f'archive_backup_{int(time.time())}')
+        
         # Create archive file
         archive_path = self.log_file.with_name(f"archive_{int(time.time())}.jsonl")
         with open(archive_path, 'w') as f:
@@ -173,7 +334,8 @@ class MnemosCompressor:
             "status": "archived",
             "archived_count": len(archive_candidates),
             "remaining_count": len(remaining_findings),
-            "archive_file": str(archive_path)
+            "archive_file": str(archive_path),
+            "backup_created": str(log_backup)
         }
     
     def delete_findings(self, delete_filter: str = None, entry_ids: List[str] = None) -> Dict[str, Any]:
@@ -211,6 +373,9 @@ class MnemosCompressor:
         if not deleted_findings:
             return {"status": "no_matches", "count": 0}
         
+        # Raw copy of the log first - the rewrite below drops lines load_findings() skipped
+        log_backup = self._backup_log(f'delete_backup_{int(time.time())}')
+        
         # Create backup before deletion
         backup_path = self.log_file.with_name(f"deleted_backup_{int(time.time())}.jsonl")
         with open(backup_path, 'w') as f:
@@ -226,9 +391,16 @@ class MnemosCompressor:
             "status": "deleted",
             "deleted_count": len(deleted_findings),
             "remaining_count": len(remaining_findings),
-            "backup_file": str(backup_path)
+            "backup_file": str(backup_path),
+            "backup_created": str(log_backup)
         }
     
+    def _backup_log(self, label: str) -> Path:
+        """Byte-for-byte copy of the log to <stem>.<label>.jsonl, taken before it is rewritten."""
+        backup_path = self.log_file.with_suffix(f'.{label}.jsonl')
+        backup_path.write_bytes(self.log_file.read_bytes())
+        return backup_path
+    
     def decompress_findings(self, compression_id: int) -> Dict[str, Any]:
         """Recover compressed findings by compression ID - reversible compression."""
         # Find the compressed archive
@@ -241,10 +413,10 @@ class MnemosCompressor:
         compressed_findings = []
         metadata = None
         
-        with open(compressed_archive_path) as f:
+        with open(compressed_archive_path, 'rb') as f:
             for line in f:
                 if line.strip():
-                    finding = json.loads(line)
+                    finding = jsonl.loads(line)
                     if finding.get("type") == "compression_metadata":
                         metadata = finding
                     else:
@@ -276,7 +448,7 @@ class MnemosCompressor:
         
         # Create backup before decompression
         backup_path = self.log_file.with_suffix(f'.pre_decompress_{compression_id}.jsonl')
-        backup_path.write_text(self.log_file.read_text())
+        backup_path.write_bytes(self.log_file.read_bytes())
         
         # Write expanded memory
         with open(self.log_file, 'w') as f:
@@ -307,10 +479,10 @@ class MnemosCompressor:
                 compression_id = int(file_path.stem.split('_')[1])
                 
                 # Read metadata
-                with open(file_path) as f:
+                with open(file_path, 'rb') as f:
                     first_line = f.readline()
                     if first_line:
-                        metadata = json.loads(first_line)
+                        metadata = jsonl.loads(first_line)
                         if metadata.get("type") == "compression_metadata":
                             compressions.append({
                                 "compression_id": compression_id,
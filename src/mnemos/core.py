@@ -14,10 +14,11 @@ CORE LOOP: OBSERVE → HYPOTHESIZE → TEST → LEARN → ITERATE
 FILES: PROTOCOL.md (methodology), README.md (overview), .mnemos/findings.jsonl (persistent memory)
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from .logging import MnemosLogger  
 from .analysis import MnemosAnalyzer
@@ -25,7 +26,36 @@ from .compression import MnemosCompressor
 from .memory_manager import AutoCompressionIntegration
 from .patterns import BehavioralPatterns
 from .patterns.surfacing import MemorySurface
-from .protocols import PROTOCOL, METHODOLOGY, BOUNDARIES, INIT_MESSAGE
+from . import protocols  # protocol text loads on first use
+
+
+# surface_memory display tables
+_TYPE_EMOJI = {
+    'discovery': '🎯', 'insight': '💡', 'observation': '👁️',
+    'issue': '🐛', 'resolved': '✅', 'pattern': '🏗️',
+    'principle': '📏', 'consideration': '💭'
+}
+_CONTENT_FIELD_BY_TYPE = {
+    'discovery': 'breakthrough', 'insight': 'understanding', 'observation': 'what',
+    'issue': 'problem', 'resolved': 'solution', 'pattern': 'insight'
+}
+_FALLBACK_CONTENT_FIELDS = ('what', 'understanding', 'breakthrough', 'problem', 'idea')
+
+
+@functools.lru_cache(maxsize=8)
+def _find_git_root(cwd: str, device: int) -> Optional[str]:
+    """Nearest directory at or above cwd containing .git - walked once per cwd.
+    
+    device (cwd's st_dev) only keys the cache, so the same path on a different
+    mount - a remount, a container volume - is walked again.
+    """
+    current = Path(cwd)
+    
+    # Search upward for .git directory
+    for parent in (current, *current.parents):
+        if os.path.exists(os.path.join(parent, '.git')):
+            return str(parent)
+    return None
 
 
 class Mnemos:
@@ -55,14 +85,21 @@ class Mnemos:
     
     def _find_mnemos_root(self):
         """Git-linked memory: .mnemos alongside .git for natural project boundaries"""
-        current = Path.cwd()
+        cwd = os.getcwd()
+        device = os.stat(cwd).st_dev
+        git_root = _find_git_root(cwd, device)
+        if git_root is not None and not os.path.exists(os.path.join(git_root, '.git')):
+            # Cached repo has since gone away - look again
+            _find_git_root.cache_clear()
+            git_root = _find_git_root(cwd, device)
+        
+        if git_root is not None:
+            # Create .mnemos alongside .git
+            mnemos_dir = Path(git_root) / '.mnemos'
+            return str(mnemos_dir), 'memory'
         
-        # Search upward for .git directory
-        for parent in [current] + list(current.parents):
-            if (parent / '.git').exists():
-                # Create .mnemos alongside .git
-                mnemos_dir = parent / '.mnemos'
-                return str(mnemos_dir), 'memory'
+        # Don't remember the miss - the user may `git init` and retry in-process
+        _find_git_root.cache_clear()
         
         # Security: Prevent context leakage - require git repo
         print("❌ MNEMOS ERROR: Not in a git repository")
@@ -174,6 +211,10 @@ class Mnemos:
     def undo(self):
         """Delegate to logger."""
         return self.logger.undo()
+    
+    def batch(self):
+        """Delegate to logger - `with mnemos.batch():` appends a burst of findings in one write."""
+        return self.logger.batch()
 
     def summarize(self):
         """Delegate to analyzer."""
@@ -181,15 +222,15 @@ class Mnemos:
     
     def protocol(self):
         """Return full investigation protocol for Claude."""
-        return PROTOCOL
+        return protocols.PROTOCOL
     
     def methodology(self):
         """Return investigation methodology reference."""
-        return METHODOLOGY
+        return protocols.METHODOLOGY
     
     def boundaries(self):
         """Return operational boundaries for autonomous work."""
-        return BOUNDARIES
+        return protocols.BOUNDARIES
     
     def search(self, term: str, search_type: str = None, limit: int = 10, show_breadcrumbs: bool = True):
         """Search investigation history with behavioral breadcrumbs."""
@@ -282,32 +323,15 @@ class Mnemos:
                     relevance = finding['relevance_score']
                     
                     # Type-specific content extraction
-                    content = ""
-                    if entry_type == 'discovery':
-                        content = entry.get('breakthrough', '')[:60]
-                    elif entry_type == 'insight':
-                        content = entry.get('understanding', '')[:60] 
-                    elif entry_type == 'observation':
-                        content = entry.get('what', '')[:60]
-                    elif entry_type == 'issue':
-                        content = entry.get('problem', '')[:60]
-                    elif entry_type == 'resolved':
-                        content = entry.get('solution', '')[:60]
-                    elif entry_type == 'pattern':
-                        content = entry.get('insight', '')[:60]
+                    field = _CONTENT_FIELD_BY_TYPE.get(entry_type)
+                    if field is not None:
+                        content = entry.get(field, '')[:60]
                     else:
                         # Generic fallback
-                        for field in ['what', 'understanding', 'breakthrough', 'problem', 'idea']:
-                            if field in entry:
-                                content = entry[field][:60]
-                                break
+                        content = next((entry[f][:60] for f in _FALLBACK_CONTENT_FIELDS if f in entry), "")
                     
                     # Format with emoji
-                    type_emoji = {
-                        'discovery': '🎯', 'insight': '💡', 'observation': '👁️',
-                        'issue': '🐛', 'resolved': '✅', 'pattern': '🏗️',
-                        'principle': '📏', 'consideration': '💭'
-                    }.get(entry_type, '📄')
+                    type_emoji = _TYPE_EMOJI.get(entry_type, '📄')
                     
                     print(f"   {type_emoji} [{entry.get('id', 'unknown')[:8]}] {content}{'...' if len(content) >= 60 else ''}")
                     print(f"     Relevance: {relevance:.0%} | {timestamp}")
@@ -360,7 +384,7 @@ class Mnemos:
         status_text = f"Findings: {status['total_findings']}, Recent: {status['recent_issues']} issues, {status['recent_discoveries']} discoveries"
         if status['active_threads']:
             status_text += f", Active threads: {', '.join(status['active_threads'])}"
-        return INIT_MESSAGE.format(status=status_text)
+        return protocols.format_init_message(status_text)
 
 
 def main():
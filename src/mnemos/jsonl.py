@@ -0,0 +1,106 @@
+"""JSON Lines codec - orjson when installed (``pip install mnemos[fast]``), stdlib json otherwise - plus append-only read positions."""
+
+import json
+import os
+from typing import Any, BinaryIO, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so either can be caught
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize one record as a newline-terminated UTF-8 JSON line."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    loads = json.loads
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize one record as a newline-terminated UTF-8 JSON line."""
+        return (json.dumps(obj) + '\n').encode()
+
+
+# Bytes compared at the start of a log and before the consumed offset to detect rewrites
+_SENTINEL_BYTES = 256
+
+# Appended bytes are read this much at a time, so a large log isn't held raw and split at once
+_READ_CHUNK = 1 << 20
+
+
+class LogPosition:
+    """How far an append-only JSONL file has been consumed - and enough of it to tell appends from rewrites.
+
+    ``offset`` is the end of the last complete line consumed; ``head`` and ``tail`` are
+    the bytes at the start of the file and just before ``offset``. If either is no
+    longer found in place, the file was rewritten (compression prepends a summary,
+    archive/delete drop lines, undo truncates) rather than appended to.
+    """
+    __slots__ = ("ino", "offset", "head", "tail")
+
+    def __init__(self, ino: int, offset: int = 0, head: bytes = b'', tail: bytes = b''):
+        self.ino = ino
+        self.offset = offset
+        self.head = head
+        self.tail = tail
+
+    def continues_in(self, f: BinaryIO, stat: os.stat_result) -> bool:
+        """Is the file still what was consumed, possibly with lines appended?"""
+        if stat.st_ino != self.ino or stat.st_size < self.offset:
+            return False
+        if not self.offset:
+            return True
+        f.seek(0)
+        if f.read(len(self.head)) != self.head:
+            return False
+        f.seek(self.offset - len(self.tail))
+        return f.read(len(self.tail)) == self.tail
+
+    def read_appended(self, f: BinaryIO, size: int) -> Tuple[List[bytes], bytes]:
+        """Lines appended since offset (up to size) and the unterminated remainder.
+
+        Advances past the complete lines only - a line still being written is
+        returned again, whole, once its newline lands.
+        """
+        f.seek(self.offset)
+        lines: List[bytes] = []
+        pending: List[bytes] = []  # pieces of the line being assembled across chunks
+        remaining = size - self.offset
+        while remaining > 0:
+            chunk = f.read(min(remaining, _READ_CHUNK))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if b'\n' not in chunk:
+                pending.append(chunk)
+                continue
+            parts = chunk.split(b'\n')
+            if pending:
+                pending.append(parts[0])
+                parts[0] = b''.join(pending)
+            pending = [parts.pop()]
+            lines.extend(parts)
+        unterminated = b''.join(pending)
+        if lines:
+            self.offset += sum(map(len, lines)) + len(lines)
+            f.seek(0)
+            self.head = f.read(min(self.offset, _SENTINEL_BYTES))
+            f.seek(max(0, self.offset - _SENTINEL_BYTES))
+            self.tail = f.read(self.offset - f.tell())
+        return lines, unterminated
+
+    def to_json(self) -> Dict[str, Any]:
+        """JSON-safe form (sentinels as latin-1 text) for sidecar files."""
+        return {"ino": self.ino, "offset": self.offset,
+                "head": self.head.decode('latin-1'), "tail": self.tail.decode('latin-1')}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'LogPosition':
+        return cls(data["ino"], data["offset"],
+                   data["head"].encode('latin-1'), data["tail"].encode('latin-1'))
@@ -1,11 +1,128 @@
 
 """Mnemos unified logging - tactical, strategic, and operational findings."""
 
-import json
+import io
+import os
+import sys
 import time
-import uuid
+import weakref
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from . import jsonl
+
+
+# Finding timestamp format - shared by every writer so equal seconds give equal strings
+_TS_FMT = "%H:%M:%S"
+
+_ts_second = -1
+_ts_text = ""
+
+
+def _echo(line: str) -> None:
+    """Echo a status line as a single stdout write (sys.stdout looked up per call, so redirection works)."""
+    sys.stdout.write(line + '\n')
+
+
+def _new_id() -> str:
+    """Short random finding ID - 8 hex chars, same shape as a truncated uuid4."""
+    return os.urandom(4).hex()
+
+
+def _timestamp() -> str:
+    """Current HH:MM:SS, formatted at most once per wall-clock second."""
+    global _ts_second, _ts_text
+    now = time.time_ns() // 1_000_000_000
+    if now != _ts_second:
+        # Format the second we cached, not a fresh clock read that may have ticked over
+        _ts_text = time.strftime(_TS_FMT, time.localtime(now))
+        _ts_second = now
+    return _ts_text
+
+
+class _SearchIndex:
+    """Column-oriented view of the log: one list per column, row i across all of them.
+    
+    Searchable string fields are lowercased into a single text blob (fields joined
+    by NUL, rows by SOH) so a query is one C-level substring scan; ``starts`` is the
+    row offset index (int64 array) that maps a match offset back to its row, and
+    ``by_type`` lists each entry type's rows so a typed search only looks at those.
+    Rows are kept as their raw JSON line - far smaller than a dict per entry - and
+    only the rows a search returns are decoded again.
+    """
+    __slots__ = ("stamp", "by_type", "rows", "blob", "starts")
+    
+    def __init__(self, stamp: Tuple[int, int], lines: Iterable[Tuple[bytes, Dict[str, Any]]]):
+        self.stamp = stamp
+        self.by_type: Dict[Optional[str], array] = {}
+        self.rows: List[bytes] = []
+        self.starts = array('q')
+        
+        texts = []
+        offset = 0
+        for row, (line, finding) in enumerate(lines):
+            text = '\x00'.join(
+                value.lower() for key, value in finding.items()
+                if isinstance(value, str) and key != 'id'
+            )
+            entry_type = finding.get('type')
+            type_rows = self.by_type.get(entry_type)
+            if type_rows is None:
+                type_rows = self.by_type[entry_type] = array('q')
+            type_rows.append(row)
+            self.rows.append(line)
+            self.starts.append(offset)
+            texts.append(text)
+            offset += len(text) + 1
+        self.blob = '\x01'.join(texts)
+    
+    def matches(self, needle: str, entry_type: Optional[str] = None) -> Iterator[int]:
+        """Yield row numbers whose searchable text contains needle, in log order."""
+        if entry_type:
+            yield from filter(self._row_matcher(needle), self.by_type.get(entry_type, ()))
+            return
+        if not self.rows:
+            return
+        blob, starts = self.blob, self.starts
+        last = len(starts) - 1
+        pos = blob.find(needle)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            yield row
+            if row == last:
+                return
+            pos = blob.find(needle, starts[row + 1])
+    
+    def matches_newest_first(self, needle: str, entry_type: Optional[str] = None) -> Iterator[int]:
+        """Yield row numbers whose searchable text contains needle, newest first."""
+        if entry_type:
+            yield from filter(self._row_matcher(needle), reversed(self.by_type.get(entry_type, ())))
+            return
+        if not self.rows:
+            return
+        blob, starts = self.blob, self.starts
+        pos = blob.rfind(needle)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            yield row
+            if row == 0:
+                return
+            pos = blob.rfind(needle, 0, starts[row] - 1)
+    
+    def _row_matcher(self, needle: str) -> Callable[[int], bool]:
+        """Predicate: does row's slice of the blob contain needle (bounded find, no copy)."""
+        find, starts = self.blob.find, self.starts
+        last = len(starts) - 1
+        blob_end = len(self.blob)
+        
+        def contains(row: int) -> bool:
+            end = blob_end if row == last else starts[row + 1] - 1
+            return find(needle, starts[row], end) != -1
+        return contains
 
 
 class MnemosLogger:
@@ -13,150 +130,59 @@ class MnemosLogger:
     
     def __init__(self, log_file: Path):
         self.log_file = log_file
+        self._fd: Optional[int] = None
+        self._closer: Optional[weakref.finalize] = None
+        self._fd_id: Optional[Tuple[int, int]] = None  # (st_dev, st_ino) the descriptor points at
+        self._index: Optional[_SearchIndex] = None
+        self._batch: Optional[List[bytes]] = None
+        self._batch_durable = False
         
     def observation(self, what: str, context: str = "") -> str:
         """Log raw findings - what you see, data points."""
-        obs_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": obs_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "what": what,
-            "context": context,
-            "type": "observation"
-        }
-        
-        self._write_finding(finding)
-        print(f"👁️ OBSERVATION: {what}")
-        return obs_id
+        return self._record("observation", f"👁️ OBSERVATION: {what}", what=what, context=context)
     
     def insight(self, understanding: str, evidence: str = "") -> str:
         """Log analyzed understanding - what observations mean."""
-        insight_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": insight_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "understanding": understanding,
-            "evidence": evidence,
-            "type": "insight"
-        }
-        
-        self._write_finding(finding)
-        print(f"💡 INSIGHT: {understanding}")
-        return insight_id
+        return self._record("insight", f"💡 INSIGHT: {understanding}",
+                            understanding=understanding, evidence=evidence)
     
     def discovery(self, breakthrough: str, impact: str, solution: str = "") -> str:
         """Log major findings that change everything - breakthroughs."""
-        discovery_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": discovery_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "breakthrough": breakthrough,
-            "impact": impact,
-            "solution": solution,
-            "type": "discovery"
-        }
-        
-        self._write_finding(finding)
-        print(f"🎯 DISCOVERY: {breakthrough}")
-        return discovery_id
+        return self._record("discovery", f"🎯 DISCOVERY: {breakthrough}", durable=True,
+                            breakthrough=breakthrough, impact=impact, solution=solution)
     
     def issue(self, problem: str, location: str, severity: str = "medium") -> str:
         """Log discovered issues concisely."""
-        issue_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": issue_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "problem": problem,
-            "location": location, 
-            "severity": severity,
-            "status": "open",
-            "type": "issue"
-        }
-        
-        self._write_finding(finding)
-        print(f"🐛 ISSUE [{issue_id}]: {problem} at {location}")
-        return issue_id
+        issue_id = _new_id()
+        return self._record("issue", f"🐛 ISSUE [{issue_id}]: {problem} at {location}", finding_id=issue_id,
+                            problem=problem, location=location, severity=severity, status="open")
     
     def resolve(self, issue_id: str, solution: str) -> str:
         """Mark issue as resolved with explicit ID linking."""
-        resolved_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": resolved_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "issue_id": issue_id,
-            "solution": solution,
-            "type": "resolved"
-        }
-        
-        self._write_finding(finding)
-        print(f"✅ RESOLVE [{issue_id}]: {solution}")
-        return resolved_id
+        return self._record("resolved", f"✅ RESOLVE [{issue_id}]: {solution}", durable=True,
+                            issue_id=issue_id, solution=solution)
     
     # Strategic memory methods
     def pattern(self, insight: str, value: str) -> str:
         """Log architectural patterns that persist across projects."""
-        pattern_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": pattern_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "insight": insight,
-            "value": value,
-            "type": "pattern"
-        }
-        
-        self._write_finding(finding)
-        print(f"🏗️ PATTERN: {insight}")
-        return pattern_id
+        return self._record("pattern", f"🏗️ PATTERN: {insight}", insight=insight, value=value)
     
     def principle(self, rule: str, rationale: str) -> str:
         """Log design principles and rules."""
-        principle_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": principle_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "rule": rule,
-            "rationale": rationale,
-            "type": "principle"
-        }
-        
-        self._write_finding(finding)
-        print(f"⚖️ PRINCIPLE: {rule}")
-        return principle_id
+        return self._record("principle", f"⚖️ PRINCIPLE: {rule}", rule=rule, rationale=rationale)
     
     def antipattern(self, problem: str, why_bad: str) -> str:
         """Log things to avoid and why."""
-        antipattern_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": antipattern_id,
-            "timestamp": time.strftime("%H:%M:%M"),
-            "problem": problem,
-            "why_bad": why_bad,
-            "type": "antipattern"
-        }
-        
-        self._write_finding(finding)
-        print(f"🚫 ANTIPATTERN: {problem}")
-        return antipattern_id
+        return self._record("antipattern", f"🚫 ANTIPATTERN: {problem}", problem=problem, why_bad=why_bad)
     
     def consideration(self, idea: str, context: str = "") -> str:
         """Log future considerations - ideas to evaluate later, not actionable tasks."""
-        consideration_id = str(uuid.uuid4())[:8]
-        finding = {
-            "id": consideration_id,
-            "timestamp": time.strftime("%H:%M:%S"),
-            "idea": idea,
-            "context": context,
-            "type": "consideration"
-        }
-        
-        self._write_finding(finding)
-        print(f"💭 CONSIDERATION: {idea}")
-        return consideration_id
+        return self._record("consideration", f"💭 CONSIDERATION: {idea}", idea=idea, context=context)
     
     def thread(self, name: str, status: str = "active") -> Dict[str, Any]:
         """Track investigation threads - what you're currently digging into."""
         finding = {
-            "timestamp": time.strftime("%H:%M:%S"),
+            "timestamp": _timestamp(),
             "thread": name,
             "status": status,  # active, completed, abandoned
             "type": "thread"
@@ -165,55 +191,154 @@ class MnemosLogger:
         self._write_finding(finding)
         return finding
     
+    def _record(self, finding_type: str, echo: str, durable: bool = False,
+                finding_id: Optional[str] = None, **fields: str) -> str:
+        """Write one ID'd finding (id, timestamp, fields..., type), echo it, return its ID."""
+        if finding_id is None:
+            finding_id = _new_id()
+        finding = {"id": finding_id, "timestamp": _timestamp(), **fields, "type": finding_type}
+        
+        self._write_finding(finding, durable)
+        _echo(echo)
+        return finding_id
+    
     def search(self, term: str, search_type: str = None, limit: int = 10) -> list:
         """Search investigation history for patterns and discoveries."""
         if not self.log_file.exists():
             return []
         
-        results = []
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                try:
-                    finding = json.loads(line.strip())
-                    
-                    # Type filtering
-                    if search_type and finding.get('type') != search_type:
-                        continue
-                    
-                    # Text search across all text fields
-                    searchable_text = []
-                    for key, value in finding.items():
-                        if isinstance(value, str) and key != 'id':
-                            searchable_text.append(value.lower())
-                    
-                    if any(term.lower() in text for text in searchable_text):
-                        results.append(finding)
-                        
-                except json.JSONDecodeError:
-                    continue
-        
-        # Return most recent first, limited
-        return results[-limit:] if results else []
-    
-    def _write_finding(self, finding: Dict[str, Any]) -> None:
-        """Write finding to log file."""
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(finding) + '\n')
+        index = self._search_index()
+        needle = term.lower()
+        
+        if limit <= 0:
+            # Degenerate limits keep their slice semantics - needs the full scan
+            results = [index.rows[row] for row in index.matches(needle, search_type)]
+            return [jsonl.loads(line) for line in results[-limit:]]
+        
+        # Scan from the end of the log and stop once `limit` matches are found
+        newest = list(islice(index.matches_newest_first(needle, search_type), limit))
+        
+        # Return the most recent matches in log order, decoded fresh from their lines
+        return [jsonl.loads(index.rows[row]) for row in reversed(newest)]
+    
+    def _search_index(self) -> _SearchIndex:
+        """Columnar index of the log, rebuilt only when the file changes on disk."""
+        stat = self.log_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._index is not None and self._index.stamp == stamp:
+            return self._index
+        
+        with open(self.log_file, 'rb') as f:
+            index = _SearchIndex(stamp, self._parse_lines(f))
+        
+        self._index = index
+        return index
+    
+    @staticmethod
+    def _parse_lines(lines: Iterable[bytes]) -> Iterator[Tuple[bytes, Dict[str, Any]]]:
+        """Decode JSON lines into (line, finding) pairs, skipping blank or corrupt ones."""
+        for line in lines:
+            try:
+                yield line, jsonl.loads(line)
+            except jsonl.JSONDecodeError:
+                continue
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect findings logged inside the block and append them with one write on exit.
+        
+        Batched findings reach the file - and so search/undo - when the block exits.
+        Nested batches fold into the outermost one.
+        """
+        if self._batch is not None:
+            yield
+            return
+        
+        self._batch = []
+        self._batch_durable = False
+        try:
+            yield
+        finally:
+            lines, self._batch = self._batch, None
+            if lines:
+                self._append(b''.join(lines), self._batch_durable)
+    
+    def _write_finding(self, finding: Dict[str, Any], durable: bool = False) -> None:
+        """Append finding to log file, or to the open batch."""
+        line = jsonl.dumps_line(finding)
+        if self._batch is not None:
+            self._batch.append(line)
+            self._batch_durable = self._batch_durable or durable
+            return
+        self._append(line, durable)
+    
+    def _append(self, data: bytes, durable: bool) -> None:
+        """One write(2) of whole lines on the cached O_APPEND descriptor."""
+        view = memoryview(data)
+        fd = self._append_fd()
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            os.fsync(fd)
+    
+    def _append_fd(self) -> int:
+        """Open the log for appending once; reopen if the path no longer names the open file.
+        
+        Covers the log being deleted, renamed away or replaced - appends always go to log_file.
+        """
+        if self._fd is not None:
+            try:
+                stat = os.stat(self.log_file)
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and (stat.st_dev, stat.st_ino) == self._fd_id:
+                return self._fd
+        
+        self.close()
+        self._fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._closer = weakref.finalize(self, os.close, self._fd)
+        opened = os.fstat(self._fd)
+        self._fd_id = (opened.st_dev, opened.st_ino)
+        return self._fd
+    
+    def flush(self) -> None:
+        """Force appended findings to stable storage."""
+        if self._fd is not None:
+            os.fsync(self._fd)
+    
+    def close(self) -> None:
+        """Release the cached log descriptor (also done at exit)."""
+        if self._closer is not None:
+            self._closer()
+        self._fd = None
+        self._closer = None
+        self._fd_id = None
 
     def undo(self) -> bool:
         """Remove the last finding from the log file."""
         if not self.log_file.exists():
             return False
         
-        with open(self.log_file, "r+") as f:
-            lines = f.readlines()
-            if not lines:
+        with open(self.log_file, "r+b") as f:
+            size = f.seek(0, io.SEEK_END)
+            if not size:
                 return False
             
-            # Move the pointer to the beginning of the last line
-            f.seek(0)
-            f.truncate()
-            f.writelines(lines[:-1])
+            # Cut the file where its last line begins - only the tail is read
+            f.truncate(self._last_line_start(f, size))
             
-        print("⏪ UNDO: Last entry removed.")
+        _echo("⏪ UNDO: Last entry removed.")
         return True
+    
+    @staticmethod
+    def _last_line_start(f, size: int) -> int:
+        """Offset of the first byte of the file's final line, scanning backwards."""
+        end = size - 1  # the final line's own terminator doesn't count
+        while end > 0:
+            start = max(0, end - io.DEFAULT_BUFFER_SIZE)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b'\n')
+            if newline != -1:
+                return start + newline + 1
+            end = start
+        return 0
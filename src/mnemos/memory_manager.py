@@ -16,8 +16,9 @@ DESIGN PRINCIPLES:
 import json
 import time
 import logging
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -30,9 +31,16 @@ class MemoryPressure(Enum):
     CRITICAL = "critical"  # > 200 entries
 
 
+# Entry counts where pressure steps up a level - _PRESSURE_LEVELS[i] covers counts below _PRESSURE_THRESHOLDS[i]
+_PRESSURE_THRESHOLDS = (50, 100, 200)
+_PRESSURE_LEVELS = (MemoryPressure.LOW, MemoryPressure.MEDIUM, MemoryPressure.HIGH, MemoryPressure.CRITICAL)
+
+
 @dataclass
 class CompressionTrigger:
     """Configuration for when and how to compress memory."""
+    __slots__ = ("name", "condition", "keep_recent", "priority", "description")
+    
     name: str
     condition: Callable[['MemoryState'], bool]
     keep_recent: int
@@ -40,9 +48,12 @@ class CompressionTrigger:
     description: str
 
 
-@dataclass 
+@dataclass(frozen=True)
 class MemoryState:
     """Current state of investigation memory."""
+    __slots__ = ("total_entries", "recent_entries", "discoveries", "patterns",
+                 "unresolved_issues", "memory_age_hours", "last_compression_hours", "_pressure")
+    
     total_entries: int
     recent_entries: int
     discoveries: int
@@ -51,17 +62,15 @@ class MemoryState:
     memory_age_hours: float
     last_compression_hours: Optional[float]
     
+    def __post_init__(self):
+        # Classified once per snapshot - every trigger condition reads it
+        object.__setattr__(self, "_pressure",
+                           _PRESSURE_LEVELS[bisect_right(_PRESSURE_THRESHOLDS, self.total_entries)])
+    
     @property
     def pressure_level(self) -> MemoryPressure:
-        """Calculate current memory pressure."""
-        if self.total_entries < 50:
-            return MemoryPressure.LOW
-        elif self.total_entries < 100:
-            return MemoryPressure.MEDIUM
-        elif self.total_entries < 200:
-            return MemoryPressure.HIGH
-        else:
-            return MemoryPressure.CRITICAL
+        """Current memory pressure (classified when the state was built)."""
+        return self._pressure
 
 
 class BiologicalMemoryManager:
@@ -74,10 +83,14 @@ class BiologicalMemoryManager:
     - Operates invisibly without manual intervention
     """
     
+    # Seconds a computed memory status is reused by pollers
+    STATUS_TTL = 5.0
+    
     def __init__(self, log_file: Path, compressor: 'MnemosCompressor'):
         self.log_file = log_file
         self.compressor = compressor
         self.logger = logging.getLogger(__name__)
+        self._status_cache: Optional[Tuple[float, Optional[Tuple[int, int]], Dict[str, Any]]] = None
         
         # Compression triggers - ordered by priority
         self.triggers = [
@@ -120,38 +133,41 @@ class BiologicalMemoryManager:
                 description="Compress to preserve discovery patterns"
             )
         ]
+        self._sort_triggers()
+    
+    def _sort_triggers(self) -> None:
+        """Cache triggers in evaluation order - redo whenever a priority changes."""
+        self._sorted_triggers = sorted(self.triggers, key=lambda t: t.priority, reverse=True)
     
     def check_memory_health(self) -> MemoryState:
         """Analyze current memory state for auto-compression decisions."""
         try:
-            findings = self.compressor.load_findings(1000)
+            stats = self.compressor.finding_stats()
+            total = stats["total"]
             
-            if not findings:
+            if not total:
                 return MemoryState(0, 0, 0, 0, 0, 0.0, None)
             
-            # Analyze memory composition
-            discoveries = len([f for f in findings if f.get("type") == "discovery"])
-            patterns = len([f for f in findings if f.get("type") in ["pattern", "principle"]])
+            # Analyze memory composition - from the compressor's stats index
+            type_counts = stats["by_type"]
+            discoveries = type_counts["discovery"]
+            patterns = type_counts["pattern"] + type_counts["principle"]
             
             # Find unresolved issues
-            all_issues = [f for f in findings if f.get("type") == "issue"]
-            resolved_ids = {f.get("issue_id") for f in findings if f.get("type") == "resolved"}
-            unresolved_issues = len([i for i in all_issues if i.get("id") not in resolved_ids])
+            unresolved_issues = stats["unresolved_issues"]
             
             # Calculate memory age (simplified - would use proper timestamps in production)
-            memory_age_hours = len(findings) * 0.1  # Rough proxy
+            memory_age_hours = total * 0.1  # Rough proxy
             
-            # Find last compression
+            # Find last compression - its id is the epoch second it ran, kept by the stats index
             last_compression_hours = None
-            for finding in reversed(findings):
-                if finding.get("type") == "semantic_summary":
-                    # Would calculate actual time difference in production
-                    last_compression_hours = 1.0  # Simplified
-                    break
+            last_compression_id = stats["last_compression_id"]
+            if isinstance(last_compression_id, (int, float)):
+                last_compression_hours = (time.time() - last_compression_id) / 3600
             
             return MemoryState(
-                total_entries=len(findings),
-                recent_entries=min(20, len(findings)),
+                total_entries=total,
+                recent_entries=min(20, total),
                 discoveries=discoveries,
                 patterns=patterns,
                 unresolved_issues=unresolved_issues,
@@ -167,7 +183,7 @@ class BiologicalMemoryManager:
     def should_compress(self, state: MemoryState) -> Optional[CompressionTrigger]:
         """Determine if compression should trigger and which strategy to use."""
         # Find highest priority trigger that matches current state
-        for trigger in sorted(self.triggers, key=lambda t: t.priority, reverse=True):
+        for trigger in self._sorted_triggers:
             try:
                 if trigger.condition(state):
                     return trigger
@@ -203,9 +219,6 @@ class BiologicalMemoryManager:
             # Execute compression with appropriate strategy
             keep_recent = trigger.keep_recent if trigger else 15
             
-            self.logger.info(f"Auto-compression triggered: {trigger.name if trigger else 'forced'}")
-            self.logger.info(f"Memory state: {state.total_entries} entries, {state.pressure_level.value} pressure")
-            
             result = self.compressor.compress_findings(keep_recent)
             
             # Enhance result with trigger information
@@ -214,8 +227,21 @@ class BiologicalMemoryManager:
                 result["trigger_description"] = trigger.description if trigger else "Manual compression"
                 result["memory_pressure"] = state.pressure_level.value
                 result["auto_compression"] = True
-                
-                self.logger.info(f"Auto-compression completed: {result['original_count']} → {result['compressed_count']} entries")
+            
+            # One record per run - trigger, memory state and outcome together
+            if self.logger.isEnabledFor(logging.INFO):
+                summary = {
+                    "trigger": trigger.name if trigger else "forced",
+                    "total_entries": state.total_entries,
+                    "pressure": state.pressure_level.value,
+                    "status": result.get("status"),
+                    "original_count": result.get("original_count"),
+                    "compressed_count": result.get("compressed_count"),
+                }
+                self.logger.info(
+                    "Auto-compression %(status)s (trigger: %(trigger)s, %(total_entries)d entries, "
+                    "%(pressure)s pressure): %(original_count)s → %(compressed_count)s entries",
+                    summary, extra={"auto_compression": summary})
             
             return result
             
@@ -228,11 +254,21 @@ class BiologicalMemoryManager:
             }
     
     def get_memory_status(self) -> Dict[str, Any]:
-        """Get current memory status for debugging/monitoring."""
+        """Get current memory status for debugging/monitoring.
+        
+        Reused for up to STATUS_TTL seconds while the log is unchanged on disk;
+        every call returns its own copy, so callers can't alter the cached status.
+        """
+        now = time.monotonic()
+        stamp = self._log_stamp()
+        if (self._status_cache is not None and now - self._status_cache[0] < self.STATUS_TTL and
+                self._status_cache[1] == stamp):
+            return self._copy_status(self._status_cache[2])
+        
         state = self.check_memory_health()
         trigger = self.should_compress(state)
         
-        return {
+        status = {
             "memory_state": {
                 "total_entries": state.total_entries,
                 "pressure_level": state.pressure_level.value,
@@ -248,6 +284,21 @@ class BiologicalMemoryManager:
             },
             "health": "healthy" if state.total_entries < 150 else "under_pressure"
         }
+        self._status_cache = (now, stamp, status)
+        return self._copy_status(status)
+    
+    @staticmethod
+    def _copy_status(status: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a status dict, including its nested sections (all other values are immutable)."""
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in status.items()}
+    
+    def _log_stamp(self) -> Optional[Tuple[int, int]]:
+        """(st_mtime_ns, st_size) of the log, None if it doesn't exist."""
+        try:
+            stat = self.log_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
     
     def configure_trigger(self, trigger_name: str, **kwargs) -> bool:
         """Dynamically configure compression triggers.
@@ -262,6 +313,8 @@ class BiologicalMemoryManager:
                         trigger.keep_recent = kwargs["keep_recent"]
                     if "priority" in kwargs:
                         trigger.priority = kwargs["priority"]
+                        self._sort_triggers()
+                    self._status_cache = None  # recommendation may have changed
                     return True
             return False
         except Exception as e:
@@ -275,20 +328,39 @@ class AutoCompressionIntegration:
     This provides the zero-ceremony interface that Claude uses.
     """
     
+    # Post-write checks are batched: at most one per BATCH_N writes or BATCH_SECS seconds
+    BATCH_N = 20
+    BATCH_SECS = 30.0
+    
     def __init__(self, log_file: Path, compressor: 'MnemosCompressor'):
         self.memory_manager = BiologicalMemoryManager(log_file, compressor)
         self.compressor = compressor
         
+        # First write always checks - one-shot CLI processes only ever write once
+        self._writes_since_check = self.BATCH_N
+        self._last_check_ts = time.monotonic()
+        
     def post_write_hook(self) -> Optional[Dict[str, Any]]:
         """Called after every memory write to check if compression needed.
         
         This is the key integration point - makes compression invisible.
+        Returns None for writes that fall inside the current batch.
         """
-        return self.memory_manager.auto_compress_if_needed()
+        self._writes_since_check += 1
+        if (self._writes_since_check < self.BATCH_N and
+                time.monotonic() - self._last_check_ts < self.BATCH_SECS):
+            return None
+        return self._check(force=False)
     
     def manual_compress(self, keep_recent: int = 15) -> Dict[str, Any]:
         """Manual compression that still uses the biological system."""
-        return self.memory_manager.auto_compress_if_needed(force=True)
+        return self._check(force=True)
+    
+    def _check(self, force: bool) -> Dict[str, Any]:
+        """Run the compression check now and start a new write batch."""
+        self._writes_since_check = 0
+        self._last_check_ts = time.monotonic()
+        return self.memory_manager.auto_compress_if_needed(force=force)
     
     def memory_status(self) -> Dict[str, Any]:
         """Get memory health status for debugging."""
@@ -0,0 +1,215 @@
+"""Shared parsed-log cache for pattern analysis."""
+
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .. import jsonl
+
+
+# Text fields mined for search terms, in extraction order
+_KEY_TERM_FIELDS = ('what', 'understanding', 'breakthrough', 'problem')
+
+
+def key_terms(entry: Dict[str, Any]) -> Tuple[str, ...]:
+    """Lowercased search terms of one entry - first 2 alphabetic words over 4 chars per field."""
+    terms: List[str] = []
+    for field in _KEY_TERM_FIELDS:
+        if field in entry:
+            words = [word for word in entry[field].lower().split()
+                     if len(word) > 4 and word.isalpha()]
+            terms.extend(words[:2])
+    return tuple(terms)
+
+
+def clock_seconds(entry: Dict[str, Any]) -> Optional[int]:
+    """Seconds since midnight of an entry's HH:MM:SS timestamp, None if missing or malformed."""
+    timestamp = entry.get('timestamp')
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        hours, minutes, seconds = map(int, timestamp.split(':'))
+    except ValueError:
+        return None
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def copy_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Caller-owned copy of a cached entry (nested lists/dicts copied too) - for public return values."""
+    return {key: _copy_json(value) for key, value in entry.items()}
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy of a decoded JSON value - containers copied, scalars shared (they're immutable)."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def window_starts(seconds: List[Optional[int]], minutes: int) -> List[int]:
+    """Index where each `minutes`-long clock window begins, given clock_seconds per entry.
+
+    A window ends when a timestamped entry falls in another bucket; entries
+    without a timestamp stay in the current window.
+    """
+    span = minutes * 60
+    starts = [0] if seconds else []
+    current_bucket = None
+    for index, second in enumerate(seconds):
+        if second is None:
+            continue
+        bucket = second // span
+        if current_bucket is not None and bucket != current_bucket:
+            starts.append(index)
+        current_bucket = bucket
+    return starts
+
+
+class _CachedLog:
+    """Parsed entries of one log plus where parsing stopped, so appends are read incrementally."""
+    __slots__ = ("position", "stamp", "entries", "partial", "derived")
+
+    def __init__(self, ino: int):
+        self.position = jsonl.LogPosition(ino)
+        self.stamp: Optional[Tuple[int, int]] = None
+        self.entries: List[Dict[str, Any]] = []
+        self.partial: Optional[Dict[str, Any]] = None
+        self.derived: Dict[Callable[[Dict[str, Any]], Any], List[Any]] = {}
+
+    def read_from(self, f: BinaryIO, size: int) -> None:
+        """Parse the lines appended since the last read, up to size."""
+        lines, unterminated = self.position.read_appended(f, size)
+        append = self.entries.append
+        for line in lines:
+            try:
+                append(jsonl.loads(line))
+            except ValueError:  # blank/corrupt line or bad encoding (JSONDecodeError is one)
+                continue
+
+        self.partial = None
+        if unterminated.strip():
+            try:
+                self.partial = jsonl.loads(unterminated)
+            except ValueError:
+                pass
+
+    def view(self) -> List[Dict[str, Any]]:
+        """Entries in log order, including an unterminated last line that parses."""
+        if self.partial is None:
+            return self.entries
+        return self.entries + [self.partial]
+    
+    def derived_view(self, derive: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        """derive(entry) for each entry of view(), computed once per entry as entries arrive."""
+        values = self.derived.setdefault(derive, [])
+        if len(values) < len(self.entries):
+            values.extend(derive(entry) for entry in self.entries[len(values):])
+        if self.partial is None:
+            return values
+        return values + [derive(self.partial)]
+
+
+# log path -> parsed log, revalidated against (st_mtime_ns, st_size) on every call
+_entries_cache: Dict[str, _CachedLog] = {}
+
+
+def load_entries(log_file: Path) -> List[Dict[str, Any]]:
+    """Load all log entries, parsing only lines appended since the last call.
+
+    The list is shared between callers and grows in place - treat it as read-only.
+    """
+    cached = _load(log_file)
+    return cached.view() if cached is not None else []
+
+
+def load_columns(log_file: Path, *derive: Callable[[Dict[str, Any]], Any]) -> Tuple[List[Any], ...]:
+    """Load all log entries plus one column per derive function (e.g. key_terms, clock_seconds).
+
+    Columns line up with the entries and follow the same sharing rules; each
+    function runs once per entry, not once per call.
+    """
+    cached = _load(log_file)
+    if cached is None:
+        return ([],) + tuple([] for _ in derive)
+    return (cached.view(),) + tuple(cached.derived_view(fn) for fn in derive)
+
+
+class LogReader:
+    """Base for the pattern analyzers - reads one log through the shared cache."""
+    
+    # Entry types this analyzer never looks at
+    SKIP_TYPES: FrozenSet[str] = frozenset()
+    
+    def __init__(self, log_file: Path):
+        self.log_file = log_file
+        self._source: Optional[List[Dict[str, Any]]] = None
+        self._source_len = 0
+        self._kept: List[Dict[str, Any]] = []
+        self._kept_at: List[int] = []  # position of each kept entry in the shared list
+        self._kept_columns: Dict[Callable[[Dict[str, Any]], Any], List[Any]] = {}
+    
+    def _load_entries(self) -> List[Dict[str, Any]]:
+        """Load all log entries minus SKIP_TYPES (shared, stat-keyed cache - read-only).
+        
+        The filtered list is extended as the shared one grows and rebuilt when
+        the log is rewritten (the cache hands back a new list).
+        """
+        return self._filter(load_entries(self.log_file))
+    
+    def _load_columns(self, *derive: Callable[[Dict[str, Any]], Any]) -> Tuple[List[Any], ...]:
+        """_load_entries() plus one column per derive function, filtered alike (see load_columns)."""
+        columns = load_columns(self.log_file, *derive)
+        if not self.SKIP_TYPES:
+            return columns
+        
+        kept = self._filter(columns[0])
+        filtered = [kept]
+        for fn, column in zip(derive, columns[1:]):
+            values = self._kept_columns.setdefault(fn, [])
+            if len(values) < len(kept):
+                values.extend(column[index] for index in self._kept_at[len(values):])
+            filtered.append(values)
+        return tuple(filtered)
+    
+    def _filter(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """entries minus SKIP_TYPES, extending the previous result when entries only grew."""
+        if not self.SKIP_TYPES:
+            return entries
+        
+        if entries is not self._source or len(entries) < self._source_len:
+            self._source, self._source_len, self._kept = entries, 0, []
+            self._kept_at, self._kept_columns = [], {}
+        if len(entries) > self._source_len:
+            skip = self.SKIP_TYPES
+            for index in range(self._source_len, len(entries)):
+                entry = entries[index]
+                if entry.get('type') not in skip:
+                    self._kept.append(entry)
+                    self._kept_at.append(index)
+            self._source_len = len(entries)
+        return self._kept
+
+
+def _load(log_file: Path) -> Optional[_CachedLog]:
+    """Bring the cached parse of log_file up to date, None if there is no log."""
+    try:
+        stat = os.stat(log_file)
+    except FileNotFoundError:
+        return None
+
+    key = str(log_file)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _entries_cache.get(key)
+    if cached is not None and cached.stamp == stamp and cached.position.ino == stat.st_ino:
+        return cached
+
+    with open(log_file, 'rb') as f:
+        if cached is None or not cached.position.continues_in(f, stat):
+            # Rewritten, replaced or truncated underneath us - start over
+            cached = _entries_cache[key] = _CachedLog(stat.st_ino)
+        cached.read_from(f, stat.st_size)
+
+    cached.stamp = stamp
+    return cached
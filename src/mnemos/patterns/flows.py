@@ -1,37 +1,42 @@
 """Investigation flow pattern analysis."""
 
-import json
-from collections import Counter
-from pathlib import Path
-from typing import List, Dict, Any
+from collections import Counter, deque
+from typing import List, Dict, Any, Optional
 
+from .cache import LogReader, clock_seconds, copy_entry, load_columns, window_starts
 
-class InvestigationFlows:
+
+# Summary content field per entry type; other types take the first fallback field present
+_CONTENT_FIELD_BY_TYPE = {
+    'observation': 'what', 'insight': 'understanding',
+    'discovery': 'breakthrough', 'issue': 'problem'
+}
+_FALLBACK_CONTENT_FIELDS = ('what', 'understanding', 'breakthrough', 'problem', 'idea')
+
+
+class InvestigationFlows(LogReader):
     """Analyzes investigation sequences and successful patterns."""
     
-    def __init__(self, log_file: Path):
-        self.log_file = log_file
-    
     def get_investigation_flows(self, limit: int = 3) -> List[Dict[str, Any]]:
         """Get common investigation flow patterns."""
         if not self.log_file.exists():
             return []
         
         flows = self._extract_investigation_flows()
-        flow_patterns = Counter()
+        flow_keys = [" → ".join(flow['types']) for flow in flows]
+        flow_patterns = Counter(flow_keys)
         
-        for flow in flows:
-            pattern = " → ".join(flow['types'])
-            flow_patterns[pattern] += 1
+        # First flow seen for each pattern serves as its example
+        first_example = {}
+        for pattern, flow in zip(flow_keys, flows):
+            first_example.setdefault(pattern, flow)
         
         common_patterns = []
         for pattern, count in flow_patterns.most_common(limit):
-            # Find a recent example of this pattern
-            example = next((f for f in flows if " → ".join(f['types']) == pattern), None)
             common_patterns.append({
                 'pattern': pattern,
                 'count': count,
-                'example': example['entries'] if example else []
+                'example': first_example[pattern]['entries']
             })
         
         return common_patterns
@@ -41,32 +46,34 @@ class InvestigationFlows:
         if not self.log_file.exists():
             return []
         
-        successful_sequences = []
-        entries = self._load_entries()
+        successful_sequences = deque(maxlen=5)  # Keep the 5 most recent successful patterns
+        window = deque(maxlen=6)  # Rolling lookback: the entry plus up to 5 before it
         
         # Find sequences ending in discoveries or resolutions
-        for i, entry in enumerate(entries):
-            if entry.get('type') in ['discovery', 'resolved']:
-                # Look back for the sequence that led to this success
-                lookback_start = max(0, i - 5)  # Look back up to 5 entries
-                sequence = entries[lookback_start:i+1]
-                
-                if len(sequence) > 1:  # Only meaningful sequences
-                    successful_sequences.append({
-                        'outcome': entry,
-                        'sequence': sequence,
-                        'pattern': " → ".join(s.get('type', 'unknown') for s in sequence)
-                    })
+        for entry in self._load_entries():
+            window.append(entry)
+            if entry.get('type') in ('discovery', 'resolved') and len(window) > 1:  # Only meaningful sequences
+                sequence = list(window)
+                successful_sequences.append({
+                    'outcome': entry,
+                    'sequence': sequence,
+                    'pattern': " → ".join(s.get('type', 'unknown') for s in sequence)
+                })
         
-        return successful_sequences[-5:]  # Return 5 most recent successful patterns
+        # Hand out copies - the sequences hold the shared cached entries
+        patterns = []
+        for found in successful_sequences:
+            sequence = [copy_entry(entry) for entry in found['sequence']]
+            patterns.append({'outcome': sequence[-1], 'sequence': sequence, 'pattern': found['pattern']})
+        return patterns
     
     def _extract_investigation_flows(self) -> List[Dict[str, Any]]:
         """Extract sequences of investigation types."""
-        entries = self._load_entries()
+        entries, seconds = load_columns(self.log_file, clock_seconds)
         flows = []
         
         # Group entries by time windows
-        time_windows = self._group_by_time_windows(entries, minutes=10)
+        time_windows = self._group_by_time_windows(entries, seconds, minutes=10)
         
         for window in time_windows:
             if len(window) > 1:  # Only meaningful flows
@@ -78,58 +85,26 @@ class InvestigationFlows:
         
         return flows
     
-    def _load_entries(self) -> List[Dict[str, Any]]:
-        """Load all log entries."""
-        entries = []
-        if not self.log_file.exists():
-            return entries
-        
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                try:
-                    entries.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
-        
-        return entries
-    
-    def _group_by_time_windows(self, entries: List[Dict], minutes: int = 5) -> List[List[Dict]]:
-        """Group entries into temporal windows."""
-        if not entries:
-            return []
-        
-        windows = []
-        current_window = [entries[0]]
-        
-        for entry in entries[1:]:
-            current_window.append(entry)
-            
-            # Start new window if we have enough entries
-            if len(current_window) >= 5:
-                windows.append(current_window)
-                current_window = []
-        
-        if current_window:
-            windows.append(current_window)
-        
-        return windows
+    def _group_by_time_windows(self, entries: List[Any], seconds: List[Optional[int]],
+                               minutes: int = 5) -> List[List[Any]]:
+        """Group entries into windows of the same `minutes`-long clock bucket.
+        
+        Entries without a parseable timestamp stay in the current window.
+        """
+        bounds = window_starts(seconds, minutes) + [len(entries)]
+        return [entries[start:end] for start, end in zip(bounds, bounds[1:])]
     
     def _summarize_entry(self, entry: Dict[str, Any]) -> Dict[str, str]:
         """Create a summary of an entry for pattern display."""
         summary = {'type': entry.get('type', 'unknown')}
         
         # Extract the main content based on type
-        if entry.get('type') == 'observation':
-            summary['content'] = entry.get('what', '')[:50] + '...'
-        elif entry.get('type') == 'insight':
-            summary['content'] = entry.get('understanding', '')[:50] + '...'
-        elif entry.get('type') == 'discovery':
-            summary['content'] = entry.get('breakthrough', '')[:50] + '...'
-        elif entry.get('type') == 'issue':
-            summary['content'] = entry.get('problem', '')[:50] + '...'
+        field = _CONTENT_FIELD_BY_TYPE.get(entry.get('type'))
+        if field is not None:
+            summary['content'] = entry.get(field, '')[:50] + '...'
         else:
             # Generic fallback
-            for field in ['what', 'understanding', 'breakthrough', 'problem', 'idea']:
+            for field in _FALLBACK_CONTENT_FIELDS:
                 if field in entry:
                     summary['content'] = entry[field][:50] + '...'
                     break
@@ -1,50 +1,49 @@
 """Location-based issue clustering analysis."""
 
-import json
-from collections import defaultdict, Counter
-from pathlib import Path
+from collections import Counter, defaultdict, deque
 from typing import List, Dict, Any
 
+from .cache import LogReader
 
-class LocationClusters:
+
+class LocationClusters(LogReader):
     """Analyzes issue patterns by location to identify hotspots."""
     
-    def __init__(self, log_file: Path):
-        self.log_file = log_file
-    
     def get_location_clusters(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get issue clusters by location."""
         if not self.log_file.exists():
             return []
         
-        location_issues = defaultdict(list)
-        
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get('type') == 'issue' and 'location' in entry:
-                        location_issues[entry['location']].append({
-                            'problem': entry['problem'],
-                            'severity': entry.get('severity', 'medium'),
-                            'timestamp': entry['timestamp']
-                        })
-                except json.JSONDecodeError:
-                    continue
+        # One pass over the shared entries - per location a count, the last 3 issues and severities
+        counts = Counter()
+        recent = defaultdict(lambda: deque(maxlen=3))  # Last 3 issues
+        severities = defaultdict(Counter)
+        for entry in self._load_entries():
+            if entry.get('type') == 'issue' and 'location' in entry:
+                location = entry['location']
+                counts[location] += 1
+                recent[location].append(entry)
+                severities[location][entry.get('severity', 'medium')] += 1
         
-        # Sort by issue count and return top locations
-        sorted_locations = sorted(
-            location_issues.items(), 
-            key=lambda x: len(x[1]), 
-            reverse=True
-        )[:limit]
+        # Keep top locations only (ties in first-seen order)
+        if limit is None or limit >= 0:
+            top_locations = counts.most_common(limit)  # heap select, O(N log limit)
+        else:
+            top_locations = counts.most_common()[:limit]  # degenerate limits keep slice semantics
         
         return [
             {
                 'location': location,
-                'issue_count': len(issues),
-                'recent_issues': issues[-3:],  # Last 3 issues
-                'severity_distribution': Counter(i['severity'] for i in issues)
+                'issue_count': count,
+                'recent_issues': [
+                    {
+                        'problem': entry['problem'],
+                        'severity': entry.get('severity', 'medium'),
+                        'timestamp': entry['timestamp']
+                    }
+                    for entry in recent[location]
+                ],
+                'severity_distribution': severities[location]
             }
-            for location, issues in sorted_locations
-        ]
\ No newline at end of file
+            for location, count in top_locations
+        ]
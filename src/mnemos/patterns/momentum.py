@@ -1,23 +1,78 @@
 """Momentum-driven investigation suggestions."""
 
-import json
-from collections import defaultdict, Counter
-from pathlib import Path
-from typing import List, Dict, Any
+from collections import Counter
+from typing import AbstractSet, Iterable, List, Dict, Any, Optional, Sequence, Tuple
 
+from .cache import LogReader, copy_entry, key_terms, load_columns
 
-class MomentumEngine:
-    """Generates investigation suggestions based on behavioral momentum patterns."""
+
+# Outcome types that count as a successful next step
+_SUCCESS_TYPES = frozenset({'discovery', 'resolved', 'insight'})
+
+# Field holding the action of each entry type that can be a next step
+_ACTION_FIELD_BY_TYPE = {
+    'observation': 'what', 'insight': 'understanding',
+    'discovery': 'breakthrough', 'issue': 'problem'
+}
+
+
+def _context_similarity(window_types: AbstractSet[str], window_keywords: AbstractSet[str],
+                        focus_types: AbstractSet[str], focus_keywords: AbstractSet[str]) -> float:
+    """Similarity of a context window to the current focus, from their type and keyword sets."""
+    # Type similarity (exact matches)
+    type_overlap = len(window_types & focus_types)
+    type_similarity = type_overlap / max(len(window_types), len(focus_types), 1)
+    
+    # Keyword similarity
+    keyword_overlap = len(window_keywords & focus_keywords)
+    keyword_similarity = keyword_overlap / max(len(window_keywords), len(focus_keywords), 1)
+    
+    # Combined similarity (weighted toward types as they're more reliable)
+    return 0.7 * type_similarity + 0.3 * keyword_similarity
+
+
+class _WindowTally:
+    """Multiset of a sliding window's items - distinct count and focus overlap kept up to date."""
+    __slots__ = ("focus", "counts", "distinct", "overlap")
     
-    def __init__(self, log_file: Path):
-        self.log_file = log_file
+    def __init__(self, focus: AbstractSet[str]):
+        self.focus = focus
+        self.counts: Counter = Counter()
+        self.distinct = 0  # len(set(window items))
+        self.overlap = 0  # len(set(window items) & focus)
+    
+    def add(self, items: Iterable[str]) -> None:
+        """Bring one entry's items into the window."""
+        for item in items:
+            if not self.counts[item]:
+                self.distinct += 1
+                if item in self.focus:
+                    self.overlap += 1
+            self.counts[item] += 1
+    
+    def remove(self, items: Iterable[str]) -> None:
+        """Drop one entry's items from the window."""
+        for item in items:
+            self.counts[item] -= 1
+            if not self.counts[item]:
+                self.distinct -= 1
+                if item in self.focus:
+                    self.overlap -= 1
+    
+    def similarity(self) -> float:
+        """overlap / max(len(window set), len(focus), 1), as in _context_similarity."""
+        return self.overlap / max(self.distinct, len(self.focus), 1)
+
+
+class MomentumEngine(LogReader):
+    """Generates investigation suggestions based on behavioral momentum patterns."""
     
     def get_momentum_suggestions(self, recent_entries: int = 3, limit: int = 3) -> List[Dict[str, Any]]:
         """Suggest next investigation steps based on behavioral momentum patterns."""
         if not self.log_file.exists():
             return []
         
-        entries = self._load_entries()
+        entries, entry_terms = load_columns(self.log_file, key_terms)
         if len(entries) < recent_entries:
             return []
         
@@ -26,7 +81,7 @@ class MomentumEngine:
         current_focus = self._extract_investigation_focus(recent_context)
         
         # Find historical patterns: what typically comes after similar contexts?
-        momentum_patterns = self._find_momentum_patterns(entries, current_focus)
+        momentum_patterns = self._find_momentum_patterns(entries, current_focus, entry_terms)
         
         # Rank suggestions by success rate and frequency
         suggestions = []
@@ -35,7 +90,7 @@ class MomentumEngine:
                 'suggestion': pattern['next_step'],
                 'confidence': pattern['success_rate'],
                 'frequency': pattern['frequency'],
-                'context': pattern['similar_context'],
+                'context': [copy_entry(entry) for entry in pattern['similar_context']],  # not the cached entries
                 'rationale': f"You typically investigate '{pattern['next_step']}' after {pattern['trigger_pattern']}"
             })
         
@@ -64,109 +119,87 @@ class MomentumEngine:
         
         return focus
     
-    def _find_momentum_patterns(self, entries: List[Dict[str, Any]], current_focus: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _find_momentum_patterns(self, entries: List[Dict[str, Any]], current_focus: Dict[str, Any],
+                                entry_terms: Optional[Sequence[Tuple[str, ...]]] = None) -> List[Dict[str, Any]]:
         """Find patterns of what typically follows similar investigation contexts."""
         patterns = []
         
+        # Per-entry types and keywords, and the focus sets, are computed once - not per window
+        if entry_terms is None:
+            entry_terms = [key_terms(entry) for entry in entries]
+        entry_types = [e.get('type', 'unknown') for e in entries]
+        focus_types = frozenset(current_focus['types'])
+        focus_keywords = frozenset(current_focus['keywords'])
+        
+        # Success rates and frequencies, tallied during the scan
+        frequency = Counter()
+        successes = Counter()
+        
+        # Rolling type/keyword tallies of the 3-entry window - each step swaps one entry out and one in
+        window_types = _WindowTally(focus_types)
+        window_keywords = _WindowTally(focus_keywords)
+        for j in range(min(3, len(entries))):
+            window_types.add((entry_types[j],))
+            window_keywords.add(entry_terms[j])
+        
         # Look for similar historical contexts
         for i in range(len(entries) - 4):  # Need at least 4 entries to see pattern
+            if i:
+                window_types.remove((entry_types[i - 1],))
+                window_types.add((entry_types[i + 2],))
+                window_keywords.remove(entry_terms[i - 1])
+                window_keywords.add(entry_terms[i + 2])
             window = entries[i:i+3]  # 3-entry context window
             next_entry = entries[i+3]
             
-            # Check if this window is similar to current focus
-            similarity_score = self._calculate_context_similarity(window, current_focus)
+            # Check if this window is similar to current focus (same weighting as _context_similarity)
+            similarity_score = 0.7 * window_types.similarity() + 0.3 * window_keywords.similarity()
             
             if similarity_score > 0.3:  # Threshold for "similar enough"
                 # What happened next?
                 next_action = self._extract_next_action(next_entry)
                 if next_action:
+                    outcome_type = next_entry.get('type', 'unknown')
                     patterns.append({
                         'next_step': next_action,
                         'similar_context': window,
-                        'trigger_pattern': " → ".join(e.get('type', 'unknown') for e in window),
-                        'outcome_type': next_entry.get('type', 'unknown'),
+                        'trigger_pattern': " → ".join(entry_types[i:i+3]),
+                        'outcome_type': outcome_type,
                         'similarity': similarity_score
                     })
+                    frequency[next_action] += 1
+                    if outcome_type in _SUCCESS_TYPES:
+                        successes[next_action] += 1
         
-        # Calculate success rates and frequencies
-        pattern_stats = defaultdict(lambda: {'count': 0, 'successes': 0})
-        
+        # Attach stats to each pattern (every next_step was counted at least once)
         for pattern in patterns:
             key = pattern['next_step']
-            pattern_stats[key]['count'] += 1
-            if pattern['outcome_type'] in ['discovery', 'resolved', 'insight']:
-                pattern_stats[key]['successes'] += 1
-        
-        # Build final pattern list with stats
-        final_patterns = []
-        for pattern in patterns:
-            key = pattern['next_step']
-            stats = pattern_stats[key]
-            pattern.update({
-                'frequency': stats['count'],
-                'success_rate': stats['successes'] / stats['count'] if stats['count'] > 0 else 0
-            })
-            final_patterns.append(pattern)
+            pattern['frequency'] = frequency[key]
+            pattern['success_rate'] = successes[key] / frequency[key]
         
         # Sort by success rate then frequency
-        return sorted(final_patterns, key=lambda x: (x['success_rate'], x['frequency']), reverse=True)
+        return sorted(patterns, key=lambda x: (x['success_rate'], x['frequency']), reverse=True)
     
     def _calculate_context_similarity(self, window: List[Dict[str, Any]], current_focus: Dict[str, Any]) -> float:
         """Calculate similarity between historical window and current focus."""
-        window_types = [e.get('type', 'unknown') for e in window]
-        window_keywords = []
-        
+        window_types = {e.get('type', 'unknown') for e in window}
+        window_keywords = set()
         for entry in window:
-            for field in ['what', 'understanding', 'breakthrough', 'problem']:
-                if field in entry:
-                    text = entry[field].lower()
-                    words = [w for w in text.split() if len(w) > 4 and w.isalpha()]
-                    window_keywords.extend(words[:2])
-        
-        # Type similarity (exact matches)
-        type_overlap = len(set(window_types) & set(current_focus['types']))
-        type_similarity = type_overlap / max(len(set(window_types)), len(set(current_focus['types'])), 1)
-        
-        # Keyword similarity
-        keyword_overlap = len(set(window_keywords) & set(current_focus['keywords']))
-        keyword_similarity = keyword_overlap / max(len(set(window_keywords)), len(set(current_focus['keywords'])), 1)
+            window_keywords.update(key_terms(entry))
         
-        # Combined similarity (weighted toward types as they're more reliable)
-        return 0.7 * type_similarity + 0.3 * keyword_similarity
+        return _context_similarity(window_types, window_keywords,
+                                   frozenset(current_focus['types']), frozenset(current_focus['keywords']))
     
     def _extract_next_action(self, entry: Dict[str, Any]) -> str:
         """Extract the key action/focus from an entry."""
-        entry_type = entry.get('type', 'unknown')
-        
-        if entry_type == 'observation':
-            content = entry.get('what', '')
-        elif entry_type == 'insight':
-            content = entry.get('understanding', '')
-        elif entry_type == 'discovery':
-            content = entry.get('breakthrough', '')
-        elif entry_type == 'issue':
-            content = entry.get('problem', '')
-        else:
+        field = _ACTION_FIELD_BY_TYPE.get(entry.get('type', 'unknown'))
+        if field is None:
             return None
         
+        content = entry.get(field, '')
         if not content:
             return None
         
         # Extract the key action or focus (first few words)
         words = content.split()[:6]  # First 6 words usually capture the essence
         return ' '.join(words)
-    
-    def _load_entries(self) -> List[Dict[str, Any]]:
-        """Load all log entries."""
-        entries = []
-        if not self.log_file.exists():
-            return entries
-        
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                try:
-                    entries.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
-        
-        return entries
\ No newline at end of file
@@ -1,18 +1,23 @@
 """Search pattern analysis for cognitive breadcrumbs."""
 
-import json
 from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from .cache import LogReader, clock_seconds, key_terms, load_columns, window_starts
 
-class SearchPatterns:
+
+class SearchPatterns(LogReader):
     """Analyzes search sequences and provides cognitive breadcrumbs."""
     
     def __init__(self, log_file: Path):
-        self.log_file = log_file
+        super().__init__(log_file)
         self.session_searches = []
+        self._index_entries: Optional[List[Dict[str, Any]]] = None
+        self._index_len = 0
+        self._index = None
     
     def track_search(self, term: str) -> None:
         """Track search term for sequence analysis."""
@@ -26,27 +31,51 @@ class SearchPatterns:
         if not self.log_file.exists():
             return []
         
-        sequences = self._extract_search_sequences()
+        sequences, term_index = self._sequence_index()
+        current = current_term.lower()
         related_terms = Counter()
         
-        # Find terms that appeared after current_term in sequences
-        for sequence in sequences:
-            if current_term.lower() in [s.lower() for s in sequence]:
-                term_index = next(i for i, s in enumerate(sequence) if s.lower() == current_term.lower())
-                # Add terms that came after this one
-                for next_term in sequence[term_index + 1:]:
-                    if next_term.lower() != current_term.lower():
-                        related_terms[next_term] += 1
+        # Find terms that appeared after current_term in sequences (terms are already lowercase)
+        for seq_id, pos in term_index.get(current, ()):
+            # Add terms that came after this one - sequences hold each term once, so none is current
+            related_terms.update(sequences[seq_id][pos + 1:])
         
         return [term for term, count in related_terms.most_common(limit)]
     
+    def _sequence_index(self) -> Tuple[List[List[str]], Dict[str, List[Tuple[int, int]]]]:
+        """Search sequences and term -> [(sequence, first position)].
+        
+        Rebuilt only when the shared entries list changes (it grows in place on
+        appends and is replaced when the log is rewritten).
+        """
+        entries, entry_terms, seconds = load_columns(self.log_file, key_terms, clock_seconds)
+        if entries is self._index_entries and len(entries) == self._index_len:
+            return self._index
+        
+        sequences = self._sequences_from_terms(entry_terms, seconds)
+        term_index: Dict[str, List[Tuple[int, int]]] = {}
+        for seq_id, sequence in enumerate(sequences):
+            for pos, term in enumerate(sequence):
+                postings = term_index.setdefault(term, [])
+                if not postings or postings[-1][0] != seq_id:  # first occurrence only
+                    postings.append((seq_id, pos))
+        
+        self._index_entries, self._index_len = entries, len(entries)
+        self._index = (sequences, term_index)
+        return self._index
+    
     def _extract_search_sequences(self) -> List[List[str]]:
         """Extract search term sequences from logs (implied by content analysis)."""
+        _, entry_terms, seconds = load_columns(self.log_file, key_terms, clock_seconds)
+        return self._sequences_from_terms(entry_terms, seconds)
+    
+    def _sequences_from_terms(self, entry_terms: List[Tuple[str, ...]],
+                              seconds: List[Optional[int]]) -> List[List[str]]:
+        """Search term sequences from per-entry key terms (cache-tokenized, in log order)."""
         sequences = []
-        entries = self._load_entries()
         
         # Group entries by time windows (5-minute sessions)
-        time_windows = self._group_by_time_windows(entries, minutes=5)
+        time_windows = self._group_by_time_windows(entry_terms, seconds, minutes=5)
         
         for window in time_windows:
             # Extract key terms from each window
@@ -56,56 +85,15 @@ class SearchPatterns:
         
         return sequences
     
-    def _load_entries(self) -> List[Dict[str, Any]]:
-        """Load all log entries."""
-        entries = []
-        if not self.log_file.exists():
-            return entries
-        
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                try:
-                    entries.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
-        
-        return entries
-    
-    def _group_by_time_windows(self, entries: List[Dict], minutes: int = 5) -> List[List[Dict]]:
-        """Group entries into temporal windows."""
-        if not entries:
-            return []
-        
-        windows = []
-        current_window = [entries[0]]
+    def _group_by_time_windows(self, entries: List[Any], seconds: List[Optional[int]],
+                               minutes: int = 5) -> List[List[Any]]:
+        """Group entries into windows of the same `minutes`-long clock bucket.
         
-        for entry in entries[1:]:
-            # Simple grouping by timestamp (this is basic - could be improved)
-            current_window.append(entry)
-            
-            # Start new window if we have enough entries
-            if len(current_window) >= 5:
-                windows.append(current_window)
-                current_window = []
-        
-        if current_window:
-            windows.append(current_window)
-        
-        return windows
+        Entries without a parseable timestamp stay in the current window.
+        """
+        bounds = window_starts(seconds, minutes) + [len(entries)]
+        return [entries[start:end] for start, end in zip(bounds, bounds[1:])]
     
-    def _extract_key_terms(self, entries: List[Dict]) -> List[str]:
-        """Extract key terms from a group of entries."""
-        terms = []
-        
-        for entry in entries:
-            # Extract meaningful terms from text fields
-            for field in ['what', 'understanding', 'breakthrough', 'problem']:
-                if field in entry:
-                    text = entry[field].lower()
-                    # Simple term extraction (could be more sophisticated)
-                    key_terms = [word for word in text.split() 
-                               if len(word) > 4 and word.isalpha()]
-                    terms.extend(key_terms[:2])  # Top 2 terms per entry
-        
-        # Return unique terms
-        return list(dict.fromkeys(terms))
\ No newline at end of file
+    def _extract_key_terms(self, entry_terms: List[Tuple[str, ...]]) -> List[str]:
+        """Unique key terms of a group of entries, from their precomputed term tuples."""
+        return list(dict.fromkeys(chain.from_iterable(entry_terms)))
\ No newline at end of file
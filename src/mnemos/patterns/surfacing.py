@@ -1,17 +1,192 @@
 """Smart Memory Surfacing - Proactive cognitive archaeology."""
 
-import json
+import functools
+import heapq
 from collections import defaultdict, Counter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import AbstractSet, FrozenSet, Iterable, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
+from .cache import LogReader, copy_entry
 
-class MemorySurface:
+
+# Common words never treated as keywords
+_STOP_WORDS = frozenset({'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'would', 'there', 'could', 'other', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'also', 'your', 'work', 'life', 'only', 'when', 'come', 'like', 'make', 'well', 'even', 'back', 'good', 'much', 'take', 'find'})
+
+
+def _extract_keywords(text: str) -> Tuple[str, ...]:
+    """Keywords of a text - first 10 alphabetic words over 3 chars that aren't stop words."""
+    # Simple keyword extraction - alphabetic words longer than 3 chars, minus common words
+    # (an alphabetic word has no punctuation left to strip)
+    keywords = [
+        word
+        for word in text.lower().split()
+        if len(word) > 3 and word not in _STOP_WORDS and word.isalpha()
+    ]
+    
+    return tuple(keywords[:10])  # Top 10 keywords
+
+
+@functools.lru_cache(maxsize=4096)
+def _keywords(text: str) -> Tuple[str, ...]:
+    """_extract_keywords, tokenized once per distinct string (context texts are re-scored on every call)."""
+    return _extract_keywords(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _keyword_set(text: str) -> FrozenSet[str]:
+    """Keywords of a text as a set, for overlap tests."""
+    return frozenset(_keywords(text)) if text else frozenset()
+
+
+def _words_sig(words: Iterable[str]) -> int:
+    """64-bit Bloom signature of a set of words - disjoint signatures guarantee disjoint sets."""
+    sig = 0
+    for word in words:
+        sig |= 1 << (hash(word) & 63)
+    return sig
+
+
+@functools.lru_cache(maxsize=4096)
+def _keyword_sig(text: str) -> int:
+    """Bloom signature of a text's keywords."""
+    return _words_sig(_keywords(text))
+
+
+_CONTENT_FIELDS = ('what', 'understanding', 'breakthrough', 'problem', 'idea', 'insight', 'rule')
+
+# The one content field each logger method writes, tried before walking _CONTENT_FIELDS
+_CONTENT_FIELD_BY_TYPE = {
+    'observation': 'what', 'insight': 'understanding', 'discovery': 'breakthrough',
+    'issue': 'problem', 'antipattern': 'problem', 'consideration': 'idea',
+    'pattern': 'insight', 'principle': 'rule'
+}
+
+
+def _entry_content(entry: Dict[str, Any]) -> Optional[str]:
+    """The main content of an entry - its type's field, else its first non-empty content field."""
+    field = _CONTENT_FIELD_BY_TYPE.get(entry.get('type'))
+    if field is not None:
+        content = entry.get(field)
+        if content:
+            return content
+    for field in _CONTENT_FIELDS:
+        if field in entry and entry[field]:
+            return entry[field]
+    return None
+
+
+def _entry_keywords(entry: Dict[str, Any]) -> Optional[Tuple[FrozenSet[str], int]]:
+    """Keyword set and Bloom signature of an entry's content, None if it has none.
+    
+    Derived once per log entry through the shared cache, so sweeps over the
+    history never re-tokenize (the lru caches above only hold 4096 texts).
+    """
+    content = _entry_content(entry)
+    if not content:
+        return None
+    keywords = frozenset(_extract_keywords(content))  # uncached - this runs once per entry anyway
+    return keywords, _words_sig(keywords)
+
+
+# Complement patterns (observation → insight → discovery)
+_COMPLEMENT_TYPES = {
+    'observation': ('insight', 'discovery'),
+    'insight': ('discovery', 'pattern'),
+    'issue': ('resolved', 'discovery')
+}
+_IMPORTANT_TYPES = frozenset({'discovery', 'pattern', 'principle'})
+
+
+class _RelevanceQuery:
+    """The context side of relevance scoring, prepared once per sweep over the history."""
+    __slots__ = ("recent_types", "keywords", "keyword_count", "themes", "theme_count",
+                 "issues_by_keyword", "explicit", "signature", "_type_scores")
+    
+    def __init__(self, context: Dict[str, Any]):
+        self.recent_types = frozenset(context['recent_types'])
+        self.keywords = frozenset(context['keywords'])
+        self.keyword_count = max(len(context['keywords']), 1)
+        self.themes = frozenset(context['themes'])
+        self.theme_count = max(len(context['themes']), 1)
+        # Inverted index keyword -> active issues (by position) mentioning it
+        self.issues_by_keyword: Dict[str, List[int]] = {}
+        for issue_no, issue in enumerate(context['active_issues']):
+            content = _entry_content(issue)
+            if content:
+                for word in _keyword_set(content):
+                    self.issues_by_keyword.setdefault(word, []).append(issue_no)
+        focus = context.get('explicit_focus')
+        self.explicit = _keyword_set(focus) if focus else None
+        # Every context word an entry's keywords could match
+        context_words = set(self.keywords)
+        context_words.update(self.themes, self.explicit or (), self.issues_by_keyword)
+        self.signature = _words_sig(context_words)
+        self._type_scores: Dict[Any, float] = {}
+    
+    def type_score(self, entry_type: Any) -> float:
+        """Same-type plus complementary-type score for an entry type."""
+        score = self._type_scores.get(entry_type)
+        if score is None:
+            score = 0.0
+            if entry_type in self.recent_types:
+                score += 0.3  # Same type recently used
+            complements = _COMPLEMENT_TYPES.get(entry_type)
+            if complements and not self.recent_types.isdisjoint(complements):
+                score += 0.2
+            self._type_scores[entry_type] = score
+        return score
+    
+    def score(self, entry_type: Any, keyed: Optional[Tuple[FrozenSet[str], int]]) -> float:
+        """Relevance of an entry, from its type and precomputed _entry_keywords."""
+        # Type relevance - same or complementary types (scored once per type)
+        score = self.type_score(entry_type)
+        
+        # Keyword relevance - skipped outright when the Bloom signatures can't overlap
+        entry_keywords = frozenset()
+        if keyed is not None and keyed[1] & self.signature:
+            entry_keywords = keyed[0]
+            if self.keywords:
+                score += 0.4 * (len(entry_keywords & self.keywords) / self.keyword_count)
+            
+            # Theme relevance (stronger signal)
+            if self.themes:
+                score += 0.5 * (len(entry_keywords & self.themes) / self.theme_count)
+        
+        # Active issue relevance
+        if entry_type == 'resolved':
+            # Check if this resolution relates to active issues
+            for _ in range(self.matching_issues(entry_keywords)):
+                score += 0.6  # Highly relevant for active problems (per matching issue)
+        
+        # Discovery/pattern relevance (always valuable)
+        if entry_type in _IMPORTANT_TYPES:
+            score += 0.2  # Boost important finding types
+        
+        # Explicit context match
+        if self.explicit is not None and keyed is not None:
+            if entry_keywords & self.explicit:
+                score += 0.7  # High boost for explicit matches
+        
+        return min(score, 1.0)  # Cap at 1.0
+    
+    def matching_issues(self, keywords: AbstractSet[str]) -> int:
+        """Number of active issues sharing at least one keyword with keywords."""
+        index = self.issues_by_keyword
+        hits = [index[word] for word in keywords if word in index]
+        if len(hits) <= 1:
+            return len(hits[0]) if hits else 0
+        return len(set().union(*hits))
+
+
+class MemorySurface(LogReader):
     """Proactive memory surfacing based on investigation context and behavioral patterns."""
     
+    # Skip compression summaries for surfacing
+    SKIP_TYPES = frozenset({'semantic_summary'})
+    
     def __init__(self, log_file: Path):
-        self.log_file = log_file
+        super().__init__(log_file)
         self.relevance_threshold = 0.4  # Minimum relevance for surfacing
         self.max_suggestions = 5  # Maximum findings to surface
     
@@ -21,7 +196,7 @@ class MemorySurface:
         if not self.log_file.exists():
             return self._empty_surface()
         
-        entries = self._load_entries()
+        entries, entry_keywords = self._load_columns(_entry_keywords)
         if len(entries) < 5:  # Need minimum history for relevance
             return self._empty_surface()
         
@@ -29,15 +204,20 @@ class MemorySurface:
         context = self._extract_current_context(entries, recent_limit, current_context)
         
         # Find relevant historical findings
-        relevant_findings = self._find_relevant_findings(entries, context)
+        relevant_findings = self._find_relevant_findings(entries, context, entry_keywords)
         
         # Surface proactive insights
         insights = self._generate_proactive_insights(relevant_findings, context)
         
+        # Returned entries are copies - the findings and active issues hold the shared cached entries
+        context['active_issues'] = [copy_entry(issue) for issue in context['active_issues']]
         return {
             'status': 'surfaced' if relevant_findings else 'no_relevant_memory',
             'context_analysis': context,
-            'relevant_findings': relevant_findings[:self.max_suggestions],
+            'relevant_findings': [
+                {**finding, 'entry': copy_entry(finding['entry'])}
+                for finding in relevant_findings[:self.max_suggestions]
+            ],
             'proactive_insights': insights,
             'surfacing_confidence': self._calculate_confidence(relevant_findings)
         }
@@ -47,7 +227,7 @@ class MemorySurface:
         if not self.log_file.exists():
             return []
         
-        entries = self._load_entries()
+        entries, entry_keywords = self._load_columns(_entry_keywords)
         
         # Find similar entries of the same type
         similar_entries = []
@@ -66,11 +246,12 @@ class MemorySurface:
                         })
         
         # Also find related discoveries/insights that followed similar patterns
-        related_outcomes = self._find_related_outcomes(entries, content_keywords)
+        related_outcomes = self._find_related_outcomes(entries, content_keywords, entry_keywords)
         
         # Combine and rank by relevance
         all_relevant = similar_entries + related_outcomes
-        return sorted(all_relevant, key=lambda x: x['similarity'], reverse=True)[:3]
+        top = heapq.nlargest(3, all_relevant, key=lambda x: x['similarity'])
+        return [{**found, 'entry': copy_entry(found['entry'])} for found in top]  # not the cached entries
     
     def _extract_current_context(self, entries: List[Dict], recent_limit: int, 
                                 explicit_context: Optional[str]) -> Dict[str, Any]:
@@ -116,16 +297,31 @@ class MemorySurface:
         
         return context
     
-    def _find_relevant_findings(self, entries: List[Dict], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _find_relevant_findings(self, entries: List[Dict], context: Dict[str, Any],
+                                entry_keywords: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
         """Find historical findings relevant to current context."""
         relevant = []
         
         # Skip recent entries (already in current context)
         historical_entries = entries[:-3] if len(entries) > 3 else []
-        
-        for entry in historical_entries:
-            relevance_score = self._calculate_relevance(entry, context)
-            if relevance_score > self.relevance_threshold:
+        entry_types = [entry.get('type', 'unknown') for entry in historical_entries]
+        
+        # Context-side sets and per-type scores are built once for the whole sweep
+        query = _RelevanceQuery(context)
+        threshold = self.relevance_threshold
+        if query.signature:
+            if entry_keywords is None:
+                entry_keywords = [_entry_keywords(entry) for entry in historical_entries]
+            scores = map(query.score, entry_types, entry_keywords)
+        else:
+            # Cold context fast path - no context words to match, so an entry scores by its type alone
+            type_scores = {entry_type: query.score(entry_type, None) for entry_type in set(entry_types)}
+            if not any(score > threshold for score in type_scores.values()):
+                return relevant
+            scores = map(type_scores.__getitem__, entry_types)
+        
+        for entry, relevance_score in zip(historical_entries, scores):
+            if relevance_score > threshold:
                 relevant.append({
                     'entry': entry,
                     'relevance_score': relevance_score,
@@ -134,64 +330,19 @@ class MemorySurface:
         
         return sorted(relevant, key=lambda x: x['relevance_score'], reverse=True)
     
-    def _calculate_relevance(self, entry: Dict[str, Any], context: Dict[str, Any]) -> float:
-        """Calculate relevance score between entry and current context."""
-        score = 0.0
-        
-        # Type relevance - same or complementary types
-        entry_type = entry.get('type', 'unknown')
-        if entry_type in context['recent_types']:
-            score += 0.3  # Same type recently used
-        
-        # Complement patterns (observation → insight → discovery)
-        complement_map = {
-            'observation': ['insight', 'discovery'],
-            'insight': ['discovery', 'pattern'],
-            'issue': ['resolved', 'discovery']
-        }
-        if entry_type in complement_map:
-            recent_types = set(context['recent_types'])
-            if any(comp_type in recent_types for comp_type in complement_map[entry_type]):
-                score += 0.2
-        
-        # Keyword relevance
-        entry_content = self._get_entry_content(entry)
-        if entry_content and context['keywords']:
-            entry_keywords = self._extract_keywords(entry_content)
-            keyword_overlap = len(set(entry_keywords) & set(context['keywords']))
-            keyword_score = keyword_overlap / max(len(context['keywords']), 1)
-            score += 0.4 * keyword_score
-        
-        # Theme relevance (stronger signal)
-        if entry_content and context['themes']:
-            entry_keywords = self._extract_keywords(entry_content)
-            theme_overlap = len(set(entry_keywords) & set(context['themes']))
-            theme_score = theme_overlap / max(len(context['themes']), 1)
-            score += 0.5 * theme_score
-        
-        # Active issue relevance
-        if entry_type == 'resolved' and context['active_issues']:
-            # Check if this resolution relates to active issues
-            for active_issue in context['active_issues']:
-                issue_keywords = self._extract_keywords(self._get_entry_content(active_issue))
-                resolved_keywords = self._extract_keywords(entry_content)
-                if len(set(issue_keywords) & set(resolved_keywords)) > 0:
-                    score += 0.6  # Highly relevant for active problems
-        
-        # Discovery/pattern relevance (always valuable)
-        if entry_type in ['discovery', 'pattern', 'principle']:
-            score += 0.2  # Boost important finding types
-        
-        # Explicit context match
-        if context.get('explicit_focus'):
-            explicit_keywords = self._extract_keywords(context['explicit_focus'])
-            if entry_content:
-                entry_keywords = self._extract_keywords(entry_content)
-                explicit_overlap = len(set(explicit_keywords) & set(entry_keywords))
-                if explicit_overlap > 0:
-                    score += 0.7  # High boost for explicit matches
-        
-        return min(score, 1.0)  # Cap at 1.0
+    def _calculate_relevance(self, entry: Dict[str, Any], context: Dict[str, Any],
+                             query: Optional['_RelevanceQuery'] = None,
+                             keyed: Optional[Tuple[FrozenSet[str], int]] = None) -> float:
+        """Calculate relevance score between entry and current context.
+        
+        keyed is the entry's precomputed _entry_keywords, derived here when not given.
+        """
+        if query is None:
+            query = _RelevanceQuery(context)
+        if keyed is None:
+            keyed = _entry_keywords(entry)
+        
+        return query.score(entry.get('type', 'unknown'), keyed)
     
     def _explain_relevance(self, entry: Dict[str, Any], context: Dict[str, Any], score: float) -> List[str]:
         """Generate human-readable explanations for why this entry is relevant."""
@@ -221,9 +372,7 @@ class MemorySurface:
         
         # Explicit focus match
         if context.get('explicit_focus') and entry_content:
-            explicit_keywords = self._extract_keywords(context['explicit_focus'])
-            entry_keywords = self._extract_keywords(entry_content)
-            if set(explicit_keywords) & set(entry_keywords):
+            if _keyword_set(context['explicit_focus']) & _keyword_set(entry_content):
                 reasons.append("Matches current investigation focus")
         
         return reasons[:3]  # Top 3 reasons
@@ -258,24 +407,34 @@ class MemorySurface:
         
         return insights
     
-    def _find_related_outcomes(self, entries: List[Dict], keywords: List[str]) -> List[Dict[str, Any]]:
+    def _find_related_outcomes(self, entries: List[Dict], keywords: List[str],
+                               entry_keywords: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
         """Find successful outcomes that followed similar investigation patterns."""
         related = []
+        keyword_set = set(keywords)
+        keyword_sig = _words_sig(keyword_set)
+        if entry_keywords is None:
+            entry_keywords = [_entry_keywords(entry) for entry in entries]
         
         for i, entry in enumerate(entries):
             if entry.get('type') in ['discovery', 'resolved', 'insight']:
                 # Look back for similar context
                 lookback_start = max(0, i - 3)
-                context_entries = entries[lookback_start:i]
+                context_entries = [keyed for keyed in entry_keywords[lookback_start:i] if keyed is not None]
+                
+                # Disjoint signatures mean zero overlap - below the threshold, no set work needed
+                window_sig = 0
+                for _, sig in context_entries:
+                    window_sig |= sig
+                if not window_sig & keyword_sig:
+                    continue
                 
-                context_content = []
-                for ctx_entry in context_entries:
-                    content = self._get_entry_content(ctx_entry)
-                    if content:
-                        context_content.extend(self._extract_keywords(content))
+                context_content = set()
+                for words, _ in context_entries:
+                    context_content.update(words)
                 
                 # Check similarity to current keywords
-                similarity = len(set(keywords) & set(context_content)) / max(len(keywords), 1)
+                similarity = len(keyword_set & context_content) / max(len(keywords), 1)
                 
                 if similarity > 0.3:
                     related.append({
@@ -288,38 +447,21 @@ class MemorySurface:
     
     def _get_entry_content(self, entry: Dict[str, Any]) -> Optional[str]:
         """Extract the main content from an entry."""
-        content_fields = ['what', 'understanding', 'breakthrough', 'problem', 'idea', 'insight', 'rule']
-        for field in content_fields:
-            if field in entry and entry[field]:
-                return entry[field]
-        return None
+        return _entry_content(entry)
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text."""
         if not text:
             return []
-        
-        # Simple keyword extraction - words longer than 3 chars, alphanumeric
-        words = text.lower().split()
-        keywords = [
-            word.strip('.,!?()[]{}";:') 
-            for word in words 
-            if len(word) > 3 and word.isalpha()
-        ]
-        
-        # Filter common words
-        stop_words = {'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'would', 'there', 'could', 'other', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'also', 'your', 'work', 'life', 'only', 'when', 'come', 'like', 'make', 'well', 'even', 'back', 'good', 'much', 'take', 'find'}
-        keywords = [k for k in keywords if k not in stop_words]
-        
-        return keywords[:10]  # Top 10 keywords
+        return list(_keywords(text))
     
     def _calculate_content_similarity(self, keywords1: List[str], content2: str) -> float:
         """Calculate content similarity between keyword list and content."""
-        keywords2 = self._extract_keywords(content2)
+        keywords2 = _keywords(content2) if content2 else ()
         if not keywords1 or not keywords2:
             return 0.0
         
-        overlap = len(set(keywords1) & set(keywords2))
+        overlap = len(set(keywords1) & _keyword_set(content2))
         return overlap / max(len(keywords1), len(keywords2))
     
     def _calculate_confidence(self, relevant_findings: List[Dict]) -> float:
@@ -343,22 +485,4 @@ class MemorySurface:
             'relevant_findings': [],
             'proactive_insights': [],
             'surfacing_confidence': 0.0
-        }
-    
-    def _load_entries(self) -> List[Dict[str, Any]]:
-        """Load all log entries."""
-        entries = []
-        if not self.log_file.exists():
-            return entries
-        
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    # Skip compression summaries for surfacing
-                    if entry.get('type') != 'semantic_summary':
-                        entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
-        
-        return entries
\ No newline at end of file
+        }
\ No newline at end of file
@@ -1,160 +1,12 @@
-"""Core investigation protocol for mnemos autonomous agents."""
+"""Core investigation protocol for mnemos autonomous agents.
 
-PROTOCOL = """# Mnemos Autonomous Investigation Protocol
-
-## Protocol Activation
-
-```python
-from mnemos import Mnemos
-mnemos = Mnemos()  # Auto-creates .mnemos/ in project root
-```
-
-## THE CORE LOOP + META-REFLECTION
-
-```
-🔄 OBSERVE → HYPOTHESIZE → TEST → LEARN → ITERATE
-     ↓ (periodic)
-🧠 META-REFLECT → PATTERN-DETECT → SYSTEMIC-INSIGHTS
-```
-
-### 1. OBSERVE
-- Examine current system state
-- Review previous findings in `.mnemos/findings.jsonl`
-- Identify patterns, anomalies, or gaps
-- **Example**: "Only 2/8 tools being used despite rich ecosystem"
-
-### 2. HYPOTHESIZE
-- Form testable theory about the observation
-- Be specific and falsifiable
-- **Example**: "Tool underutilization caused by task design, not architecture"
-
-### 3. TEST
-- Design minimal experiment to test hypothesis
-- Use available tools: code reading, grep, file analysis
-- **Example**: "Check tool descriptions vs actual usage patterns"
-
-### 4. LEARN
-- Log findings immediately using mnemos methods
-- Revise understanding based on evidence
-- **Example**: "CONFIRMED - tools work when genuinely required"
-
-### 5. ITERATE
-- Use learnings to inform next observation
-- Follow evidence trails, not predetermined paths
-- **Example**: Discovery leads to investigating mode switching mechanisms
-
-## LOGGING PROTOCOL
-
-**MANDATORY**: Log every significant finding immediately:
-
-```python
-# TACTICAL (session-specific)
-mnemos.observation("Raw data, what you see")
-mnemos.insight("Analysis, what it means")
-mnemos.discovery("Breakthrough insight that changes everything")
-mnemos.issue("Problems found", location="file:line", severity="critical|medium|low")
-mnemos.resolve(issue_id, "How the problem was fixed")
-
-# STRATEGIC (cross-project knowledge)
-mnemos.pattern("Architectural insight that applies broadly")
-mnemos.principle("Design rule or guideline")
-mnemos.antipattern("What to avoid and why")
-
-# INVESTIGATION MANAGEMENT
-mnemos.thread("investigation_name", status="active|completed|abandoned")
-```
-
-## META-REFLECTION TRIGGERS
-
-Mnemos automatically suggests meta-reflection when:
-- 10+ findings accumulated since last reflection
-- Active threads stagnate
-- Similar issues recurring
-- Discovery patterns emerge
-
-**Run**: `mnemos.meta_reflect()` for automatic pattern detection across all findings.
-
-## AUTONOMOUS DECISION MAKING
-
-You are encouraged to:
-1. **Follow curiosity** - investigate interesting anomalies
-2. **Trust the process** - let evidence guide direction
-3. **Think like a detective** - "hmm, that's suspicious..."
-4. **Be systematically thorough** - check obvious things first
-5. **Connect dots** - look for patterns across findings
-
-Remember: **Every investigation teaches us something**. There are no failed investigations, only insights about what doesn't work.
-
-## MEMORY COMPRESSION
-
-When memory grows large (>50 findings), mnemos uses semantic compression:
-- **Preserves**: Discoveries, patterns, principles, critical issues
-- **Compresses**: Routine observations, resolved issues
-- **Intelligence**: Gets smarter over time, not just bigger
-
-Run `mnemos.compress_findings()` manually or let automatic triggers handle it.
+PROTOCOL, METHODOLOGY and BOUNDARIES are packed in _protocol_pack (see
+scripts/pack_protocols.py) and decoded on first access.
 """
 
-METHODOLOGY = """# Investigation Methodology
-
-## Human-Like Discovery Process
-
-1. **Start with obvious questions** - "What's actually happening here?"
-2. **Follow evidence trails** - Each finding suggests next steps
-3. **Trust instincts** - If something feels wrong, investigate
-4. **Be systematically chaotic** - Structured but not rigid
-5. **Connect unexpected dots** - Look for surprising patterns
-
-## Evidence Quality Hierarchy
-
-1. **Discoveries** - Game-changing insights that shift understanding
-2. **Patterns** - Recurring structures across multiple contexts
-3. **Insights** - Analyzed understanding from observations
-4. **Issues** - Problems that block progress
-5. **Observations** - Raw data without interpretation
-
-## Investigation Flow States
-
-- **Exploration** - Broad discovery, following curiosity
-- **Deep Dive** - Focused investigation of specific phenomena
-- **Pattern Recognition** - Connecting dots across findings
-- **Validation** - Testing hypotheses and theories
-- **Meta-Analysis** - Reflecting on investigation process itself
-"""
-
-BOUNDARIES = """# Operational Boundaries
-
-## Autonomous Guidelines
-
-✅ **DO**:
-- Investigate genuinely interesting anomalies
-- Follow evidence trails systematically
-- Log findings immediately
-- Ask "why" and "what if" questions
-- Connect patterns across different contexts
-- Trust your investigative instincts
+from typing import Any
 
-❌ **DON'T**:
-- Investigate purely theoretical questions
-- Make changes without understanding impact
-- Skip logging important discoveries
-- Ignore obvious explanations
-- Force connections where none exist
-- Second-guess evidence-based conclusions
-
-## Scope Management
-
-**Focus on**: Observable phenomena, behavioral patterns, system interactions
-**Avoid**: Abstract philosophy, hypothetical scenarios, non-testable theories
-
-## Success Metrics
-
-A successful investigation produces:
-1. **Understanding** - Clear picture of what's happening
-2. **Actionable insights** - Knowledge that enables better decisions
-3. **Patterns** - Transferable learning for future investigations
-4. **Documentation** - Persistent memory for future reference
-"""
+_PACKED_NAMES = ('PROTOCOL', 'METHODOLOGY', 'BOUNDARIES')
 
 INIT_MESSAGE = """🤖 **MNEMOS AUTONOMOUS INVESTIGATION INITIALIZED**
 
@@ -176,4 +28,21 @@ INIT_MESSAGE = """🤖 **MNEMOS AUTONOMOUS INVESTIGATION INITIALIZED**
 **Remember**: Every finding matters. Trust the process. Follow the evidence.
 
 🔍 **Begin autonomous discovery!**
-"""
\ No newline at end of file
+"""
+
+# INIT_MESSAGE split around its one {status} field, so rendering is a concatenation
+_INIT_PREFIX, _INIT_SUFFIX = INIT_MESSAGE.split('{status}', 1)
+
+
+def format_init_message(status: str) -> str:
+    """INIT_MESSAGE with status filled in - same as INIT_MESSAGE.format(status=status)."""
+    return _INIT_PREFIX + status + _INIT_SUFFIX
+
+
+def __getattr__(name: str) -> Any:
+    """Unpack a protocol text on first access."""
+    if name not in _PACKED_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import _protocol_pack  # the blob loads only once a packed text is read
+    value = globals()[name] = _protocol_pack.text(name)
+    return value
@@ -1,7 +1,33 @@
 """Embedded protocol strings for mnemos agent guidelines."""
 
-from .protocol_core import PROTOCOL, METHODOLOGY, BOUNDARIES, INIT_MESSAGE
-from .protocol_examples import ADVANCED_EXAMPLES, INVESTIGATION_CHECKLISTS
+import importlib
+from typing import Any, List
 
-# All protocol content now imported from modular files
-# protocols.py serves as single import point for backward compatibility
\ No newline at end of file
+# All protocol content lives in modular files, imported on first access (PEP 562)
+# protocols.py serves as single import point for backward compatibility
+_SOURCES = {
+    'PROTOCOL': 'protocol_core',
+    'METHODOLOGY': 'protocol_core',
+    'BOUNDARIES': 'protocol_core',
+    'INIT_MESSAGE': 'protocol_core',
+    'format_init_message': 'protocol_core',
+    'ADVANCED_EXAMPLES': 'protocol_examples',
+    'INVESTIGATION_CHECKLISTS': 'protocol_examples',
+}
+
+__all__ = list(_SOURCES)
+
+
+def __getattr__(name: str) -> Any:
+    """Load a protocol string from its module the first time it is asked for."""
+    module = _SOURCES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __package__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """Module attributes including the protocol names not loaded yet."""
+    return sorted(set(globals()) | set(_SOURCES))
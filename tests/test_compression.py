@@ -0,0 +1,158 @@
+"""Tests for findings compression and its stats index."""
+
+import json
+import os
+
+from mnemos import jsonl
+from mnemos.compression import MnemosCompressor
+from mnemos.memory_manager import BiologicalMemoryManager
+
+
+def test_corrupt_lines_are_skipped_consistently(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    lines = [json.dumps({"id": str(i), "type": "observation", "what": f"finding {i}"}) for i in range(250)]
+    lines[100] = '{"type": "observation", "what": "cut off'
+    lines[200] = '[1, 2]'
+    log_file.write_text("\n".join(lines) + "\n")
+    compressor = MnemosCompressor(log_file)
+    
+    findings = compressor.load_findings()
+    assert len(findings) == compressor.finding_stats()["total"] == 248
+    assert len(compressor.load_findings(10)) == 10
+    
+    result = BiologicalMemoryManager(log_file, compressor).auto_compress_if_needed()
+    assert result["status"] == "reversible_compression"
+    assert result["original_count"] == 248
+
+
+def _log_with_corrupt_line(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    raw = (
+        json.dumps({"id": "1", "type": "observation", "what": "keep me"}) + "\n"
+        + '{"type": "observation", "what": "cut off\n'
+        + json.dumps({"id": "3", "type": "observation", "what": "stale note"}) + "\n"
+    )
+    log_file.write_text(raw)
+    return log_file, raw
+
+
+def test_archive_backs_up_raw_log(tmp_path):
+    log_file, raw = _log_with_corrupt_line(tmp_path)
+    
+    result = MnemosCompressor(log_file).archive_findings(archive_filter="stale")
+    assert result["status"] == "archived" and result["archived_count"] == 1
+    assert open(result["backup_created"]).read() == raw
+    assert "stale" not in log_file.read_text()
+
+
+def test_delete_backs_up_raw_log(tmp_path):
+    log_file, raw = _log_with_corrupt_line(tmp_path)
+    
+    result = MnemosCompressor(log_file).delete_findings(entry_ids=["3"])
+    assert result["status"] == "deleted" and result["deleted_count"] == 1
+    assert open(result["backup_created"]).read() == raw
+    assert "stale" not in log_file.read_text()
+
+
+def _line(i, entry_type="observation", what="finding"):
+    return json.dumps({"id": str(i), "type": entry_type, "what": f"{what} {i}"}) + "\n"
+
+
+def _long_line(i, entry_type="observation"):
+    # Longer than the 256-byte sentinels, so head and tail are checked independently
+    return _line(i, entry_type, "x" * 300)
+
+
+def _consume(log_file, position=None):
+    """(position, continued, lines, unterminated) after reading log_file from position."""
+    stat = os.stat(log_file)
+    with open(log_file, 'rb') as f:
+        continued = position is not None and position.continues_in(f, stat)
+        if not continued:
+            position = jsonl.LogPosition(stat.st_ino)
+        lines, unterminated = position.read_appended(f, stat.st_size)
+    return position, continued, lines, unterminated
+
+
+def test_log_position_extends_over_appends(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text(_line(0) + _line(1))
+    position, _, lines, _ = _consume(log_file)
+    assert len(lines) == 2
+    
+    with open(log_file, 'a') as f:
+        f.write(_line(2) + '{"id": "3"')
+    position, continued, lines, unterminated = _consume(log_file, position)
+    assert continued
+    assert lines == [_line(2).rstrip("\n").encode()]
+    assert unterminated == b'{"id": "3"'
+    assert position.offset == len(_line(0) + _line(1) + _line(2))
+
+
+def test_log_position_detects_undo_truncation(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text(_long_line(0) + _long_line(1))
+    position = _consume(log_file)[0]
+    
+    log_file.write_text(_long_line(0))
+    assert not _consume(log_file, position)[1]
+    # Undo followed by an append of the same size leaves only the tail sentinel to notice
+    log_file.write_text(_long_line(0) + _long_line(7))
+    assert os.path.getsize(log_file) == position.offset
+    assert not _consume(log_file, position)[1]
+
+
+def test_log_position_detects_rewrite_on_same_inode(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text("".join(_long_line(i) for i in range(5)))
+    position = _consume(log_file)[0]
+    ino = os.stat(log_file).st_ino
+    
+    # Compression rewrites in place: summary first, then the kept findings, file grows
+    with open(log_file, 'w') as f:
+        f.write(_long_line("s", "semantic_summary") + "".join(_long_line(i) for i in range(5)))
+    assert os.stat(log_file).st_ino == ino
+    assert not _consume(log_file, position)[1]
+    
+    # A rewrite that keeps the tail in place leaves only the head sentinel to notice
+    log_file.write_text("".join(_long_line(i) for i in range(5)))
+    position = _consume(log_file)[0]
+    with open(log_file, 'w') as f:
+        f.write(_long_line(9) + "".join(_long_line(i) for i in range(1, 6)))
+    assert not _consume(log_file, position)[1]
+
+
+def test_stale_or_corrupt_stats_sidecar_is_rebuilt(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text(_line(0, "issue") + _line(1) + _line(2))
+    compressor = MnemosCompressor(log_file)
+    expected = compressor.finding_stats()
+    assert compressor.stats_file.exists()
+    
+    for sidecar in ('{"position": ', '[]', '{"position": {"ino": 1}, "rows": []}'):
+        compressor.stats_file.write_text(sidecar)
+        assert MnemosCompressor(log_file).finding_stats() == expected
+    
+    # A sidecar written for an earlier version of the log
+    log_file.write_text(_line(0, "issue") + _line(1))
+    stale = MnemosCompressor(log_file)
+    stale.finding_stats()
+    log_file.write_text(_line(3) + _line(4, "issue") + _line(5, "issue"))
+    stats = MnemosCompressor(log_file).finding_stats()
+    assert stats["total"] == 3 and stats["unresolved_issues"] == 2
+    assert json.loads(stale.stats_file.read_text())["rows"] == [["observation", None], ["issue", "4"], ["issue", "5"]]
+
+
+def test_unterminated_last_line_counts_but_is_not_indexed(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text(_line(0) + _line(1) + _line(2, "issue").rstrip("\n"))
+    compressor = MnemosCompressor(log_file)
+    
+    stats = compressor.finding_stats()
+    assert stats["total"] == 3 and stats["unresolved_issues"] == 1
+    assert len(json.loads(compressor.stats_file.read_text())["rows"]) == 2
+    
+    with open(log_file, 'a') as f:
+        f.write("\n")
+    assert MnemosCompressor(log_file).finding_stats() == stats
+    assert len(json.loads(compressor.stats_file.read_text())["rows"]) == 3
@@ -0,0 +1,104 @@
+"""Tests for the append-only finding log."""
+
+import json
+import os
+
+from mnemos.logging import MnemosLogger
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_append_follows_renamed_log(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    logger = MnemosLogger(log_file)
+    logger.observation("first finding")
+    
+    os.rename(log_file, tmp_path / "memory.jsonl.bak")
+    logger.observation("second finding")
+    
+    assert [f["what"] for f in _read(log_file)] == ["second finding"]
+    assert [f["what"] for f in _read(tmp_path / "memory.jsonl.bak")] == ["first finding"]
+
+
+def test_append_follows_replaced_log(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    logger = MnemosLogger(log_file)
+    logger.observation("first finding")
+    
+    replacement = tmp_path / "replacement.jsonl"
+    replacement.write_text(json.dumps({"type": "observation", "what": "kept"}) + "\n")
+    os.replace(replacement, log_file)
+    logger.observation("second finding")
+    
+    assert [f["what"] for f in _read(log_file)] == ["kept", "second finding"]
+
+
+def test_append_recreates_deleted_log(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    logger = MnemosLogger(log_file)
+    logger.observation("first finding")
+    
+    log_file.unlink()
+    logger.observation("second finding")
+    
+    assert [f["what"] for f in _read(log_file)] == ["second finding"]
+
+
+def _naive_search(path, term, search_type=None, limit=10):
+    """The plain line-by-line scan search() must agree with."""
+    results = []
+    for line in path.read_text().splitlines():
+        try:
+            finding = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if search_type and finding.get('type') != search_type:
+            continue
+        texts = [value.lower() for key, value in finding.items() if isinstance(value, str) and key != 'id']
+        if any(term.lower() in text for text in texts):
+            results.append(finding)
+    return results[-limit:] if results else []
+
+
+def _search_log(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    entries = [
+        {"id": "cache-0", "type": "observation", "what": "Cache miss on first row"},
+        {"id": "1", "type": "issue", "what": "Race in cache eviction", "location": "cache.py:40"},
+        {"id": "2", "type": "insight", "understanding": "no match here", "confidence": 0.5},
+        {"id": "cache-3", "type": "observation", "what": "id field alone must not match"},
+        {"id": "4", "type": "resolved", "issue_id": "1", "what": "fixed the CACHE race"},
+        {"id": "5", "type": "discovery", "understanding": "Ünïcode Cache", "tags": ["cache"]},
+        {"id": "6", "type": "observation", "what": "last row: cache"},
+    ]
+    lines = [json.dumps(entry) for entry in entries]
+    lines.insert(3, '{"type": "observation", "what": "cache cut off')
+    lines.insert(5, "")
+    log_file.write_text("\n".join(lines) + "\n")
+    return log_file
+
+
+def test_search_matches_naive_filter(tmp_path):
+    log_file = _search_log(tmp_path)
+    logger = MnemosLogger(log_file)
+    
+    for term in ("cache", "CACHE", "first row", "last row", "ünïcode", "ün", "cache-", "nothing", ""):
+        for search_type in (None, "observation", "issue", "discovery", "pattern"):
+            for limit in (-2, -1, 0, 1, 2, 3, 10):
+                assert logger.search(term, search_type, limit) == _naive_search(log_file, term, search_type, limit), \
+                    (term, search_type, limit)
+
+
+def test_search_sees_same_size_rewrite(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text(json.dumps({"id": "1", "type": "observation", "what": "alpha"}) + "\n")
+    logger = MnemosLogger(log_file)
+    assert [f["what"] for f in logger.search("alpha")] == ["alpha"]
+    
+    size = log_file.stat().st_size
+    log_file.write_text(json.dumps({"id": "1", "type": "observation", "what": "gamma"}) + "\n")
+    assert log_file.stat().st_size == size
+    assert logger.search("alpha") == _naive_search(log_file, "alpha") == []
+    assert [f["what"] for f in logger.search("gamma")] == ["gamma"]
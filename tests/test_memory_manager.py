@@ -0,0 +1,37 @@
+"""Tests for biological memory management."""
+
+import json
+import time
+
+from mnemos.compression import MnemosCompressor
+from mnemos.memory_manager import BiologicalMemoryManager
+
+
+def _manager(tmp_path, entries):
+    log_file = tmp_path / "memory.jsonl"
+    log_file.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+    return BiologicalMemoryManager(log_file, MnemosCompressor(log_file))
+
+
+def test_memory_status_is_a_copy(tmp_path):
+    manager = _manager(tmp_path, [{"id": str(i), "type": "observation", "what": "x"} for i in range(30)])
+    
+    status = manager.get_memory_status()
+    expected = json.dumps(status, sort_keys=True)
+    status["health"] = "X"
+    status["memory_state"]["total_entries"] = -1
+    status["compression_recommendation"]["should_compress"] = "X"
+    
+    assert json.dumps(manager.get_memory_status(), sort_keys=True) == expected
+
+
+def test_last_compression_hours_from_compression_id(tmp_path):
+    five_hours_ago = int(time.time()) - 5 * 3600
+    entries = [{"id": "s", "type": "semantic_summary", "compression_id": five_hours_ago}]
+    entries += [{"id": str(i), "type": "observation", "what": "x"} for i in range(80)]
+    manager = _manager(tmp_path, entries)
+    
+    state = manager.check_memory_health()
+    assert 4.9 < state.last_compression_hours < 5.1
+    assert manager.compressor.finding_stats()["last_compression_id"] == five_hours_ago
+    assert MnemosCompressor(manager.compressor.log_file).finding_stats()["last_compression_id"] == five_hours_ago
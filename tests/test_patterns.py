@@ -0,0 +1,103 @@
+"""Tests for the pattern analyzers over the shared log cache."""
+
+import json
+
+from mnemos.compression import MnemosCompressor
+from mnemos.logging import MnemosLogger
+from mnemos.patterns.cache import load_entries
+from mnemos.patterns.flows import InvestigationFlows
+from mnemos.patterns.momentum import MomentumEngine
+from mnemos.patterns.surfacing import MemorySurface
+
+
+def _write_log(path, entries):
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+
+def _history(path):
+    entries = []
+    for i in range(4):
+        entries += [
+            {"id": f"i{i}", "type": "issue", "timestamp": "10:00:00",
+             "problem": "cache invalidation breaks parser", "location": "parser.py"},
+            {"type": "observation", "timestamp": "10:00:01", "what": "parser cache stale after reload"},
+            {"type": "insight", "timestamp": "10:00:02", "understanding": "parser cache keyed by path only"},
+            {"type": "discovery", "timestamp": "10:00:03", "breakthrough": "parser cache needs mtime key",
+             "impact": "fixes reload"},
+        ]
+    _write_log(path, entries)
+
+
+def test_successful_patterns_are_copies(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    _history(log_file)
+    flows = InvestigationFlows(log_file)
+    
+    patterns = flows.get_successful_patterns()
+    assert patterns and patterns[0]["outcome"] is patterns[0]["sequence"][-1]
+    expected = json.dumps(patterns, sort_keys=True)
+    for pattern in patterns:
+        pattern["outcome"]["type"] = "X"
+    
+    assert json.dumps(flows.get_successful_patterns(), sort_keys=True) == expected
+
+
+def test_surfaced_entries_are_copies(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    _history(log_file)
+    surface = MemorySurface(log_file)
+    
+    expected = surface.surface_relevant_memory("parser cache")
+    assert expected["relevant_findings"]
+    expected_json = json.dumps(expected, sort_keys=True)
+    
+    for finding in expected["relevant_findings"]:
+        finding["entry"]["type"] = "X"
+    for issue in expected["context_analysis"]["active_issues"]:
+        issue["problem"] = "X"
+    for found in surface.surface_for_entry_type("discovery", "parser cache needs mtime key"):
+        found["entry"]["breakthrough"] = "X"
+    
+    assert json.dumps(surface.surface_relevant_memory("parser cache"), sort_keys=True) == expected_json
+
+
+def test_momentum_context_is_copied(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    _history(log_file)
+    engine = MomentumEngine(log_file)
+    
+    suggestions = engine.get_momentum_suggestions()
+    assert suggestions
+    expected = json.dumps(suggestions, sort_keys=True)
+    for suggestion in suggestions:
+        for entry in suggestion["context"]:
+            entry["type"] = "X"
+    
+    assert json.dumps(engine.get_momentum_suggestions(), sort_keys=True) == expected
+
+
+def test_cached_entries_follow_append_undo_and_compress(tmp_path):
+    log_file = tmp_path / "memory.jsonl"
+    logger = MnemosLogger(log_file)
+    
+    def fresh_parse():
+        return [json.loads(line) for line in log_file.read_text().splitlines()]
+    
+    for i in range(20):
+        logger.observation(f"o{i}")
+    assert load_entries(log_file) == fresh_parse()
+    
+    assert logger.undo()
+    assert load_entries(log_file) == fresh_parse()
+    # Undo then a longer append, unseen in between - the file grows past what was parsed
+    assert logger.undo()
+    logger.insight("parser cache keyed by path only")
+    assert load_entries(log_file) == fresh_parse()
+    
+    # Compressing a short log grows it: the summary outweighs the few findings it replaces
+    size = log_file.stat().st_size
+    assert MnemosCompressor(log_file).compress_findings(keep_recent=15)["status"] == "reversible_compression"
+    assert log_file.stat().st_size > size
+    assert load_entries(log_file) == fresh_parse()
+    logger.discovery("parser cache needs mtime key", "fixes reload")
+    assert load_entries(log_file) == fresh_parse()